@@ -203,19 +203,11 @@ Documentation
 
 """
 
+import importlib
 import os
 import sys
-from typing import Generator
-
-from rich import traceback
-
-from flytekit.lazy_import.lazy_module import lazy_module
-
-if sys.version_info < (3, 10):
-    from importlib_metadata import entry_points
-else:
-    from importlib.metadata import entry_points
-
+from functools import lru_cache
+from typing import Generator, Tuple
 
 from flytekit._version import __version__
 from flytekit.configuration import Config
@@ -245,6 +237,7 @@ from flytekit.core.workflow import ImperativeWorkflow as Workflow
 from flytekit.core.workflow import WorkflowFailurePolicy, reference_workflow, workflow
 from flytekit.deck import Deck
 from flytekit.image_spec import ImageSpec
+from flytekit.lazy_import.lazy_module import lazy_module
 from flytekit.loggers import LOGGING_RICH_FMT_ENV_VAR, logger
 from flytekit.models.common import Annotations, AuthRole, Labels
 from flytekit.models.core.execution import WorkflowExecutionPhase
@@ -252,7 +245,6 @@ from flytekit.models.core.types import BlobType
 from flytekit.models.documentation import Description, Documentation, SourceCode
 from flytekit.models.literals import Blob, BlobMetadata, Literal, Scalar
 from flytekit.models.types import LiteralType
-from flytekit.remote import FlyteRemote
 from flytekit.sensor.sensor_engine import SensorEngine
 from flytekit.types import directory, file, iterator
 from flytekit.types.directory import FlyteDirectory
@@ -264,6 +256,103 @@ from flytekit.types.structured.structured_dataset import (
     StructuredDatasetType,
 )
 
+__all__ = [
+    "Annotations",
+    "Artifact",
+    "AuthRole",
+    "BatchSize",
+    "Blob",
+    "BlobMetadata",
+    "BlobType",
+    "Checkpoint",
+    "Config",
+    "ContainerTask",
+    "CronSchedule",
+    "Deck",
+    "Description",
+    "Documentation",
+    "Email",
+    "ExecutionParameters",
+    "FixedRate",
+    "FlyteContext",
+    "FlyteContextManager",
+    "FlyteDirectory",
+    "FlyteFile",
+    "FlyteRemote",
+    "HashMethod",
+    "ImageSpec",
+    "LOGGING_RICH_FMT_ENV_VAR",
+    "LaunchPlan",
+    "LaunchPlanReference",
+    "Labels",
+    "Literal",
+    "LiteralType",
+    "Options",
+    "PagerDuty",
+    "PodTemplate",
+    "PythonFunctionTask",
+    "PythonInstanceTask",
+    "Resources",
+    "SQLTask",
+    "Scalar",
+    "Secret",
+    "SecurityContext",
+    "SensorEngine",
+    "Slack",
+    "SourceCode",
+    "StructuredDataset",
+    "StructuredDatasetFormat",
+    "StructuredDatasetTransformerEngine",
+    "StructuredDatasetType",
+    "TaskMetadata",
+    "TaskReference",
+    "Workflow",
+    "WorkflowExecutionPhase",
+    "WorkflowFailurePolicy",
+    "WorkflowReference",
+    "approve",
+    "conditional",
+    "current_context",
+    "directory",
+    "dynamic",
+    "file",
+    "get_reference_entity",
+    "iterator",
+    "kwtypes",
+    "lazy_module",
+    "load_implicit_plugins",
+    "logger",
+    "map_task",
+    "new_context",
+    "reference_launch_plan",
+    "reference_task",
+    "reference_workflow",
+    "sleep",
+    "task",
+    "wait_for_input",
+    "workflow",
+]
+
+# Names that are resolved on first attribute access rather than at ``import flytekit`` time. These modules are not
+# needed to author or run tasks and pull in a large dependency tree (grpc clients, auth, etc.), so deferring them keeps
+# the import cheap for CLI invocations that never touch them.
+_LAZY_ATTRIBUTES = {
+    "FlyteRemote": "flytekit.remote",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 def current_context() -> ExecutionParameters:
     """
@@ -285,6 +374,25 @@ def new_context() -> Generator[FlyteContext, None, None]:
     return FlyteContextManager.with_context(FlyteContextManager.current_context().new_builder())
 
 
+def _entry_points(group: str):
+    # The backport pulls in its own dependency tree, only import it when plugins are actually discovered.
+    if sys.version_info < (3, 10):
+        from importlib_metadata import entry_points
+    else:
+        from importlib.metadata import entry_points
+
+    return entry_points(group=group)
+
+
+@lru_cache
+def _discover_implicit_plugins() -> Tuple:
+    """
+    Scanning the entry points requires reading the metadata of every installed distribution, so the result is computed
+    once per process.
+    """
+    return tuple(_entry_points(group="flytekit.plugins"))
+
+
 def load_implicit_plugins():
     """
     This method allows loading all plugins that have the entrypoint specification. This uses the plugin loading
@@ -314,14 +422,34 @@ def load_implicit_plugins():
        # etc
 
     """
-    discovered_plugins = entry_points(group="flytekit.plugins")
+    discovered_plugins = _discover_implicit_plugins()
+    # Plugins are loaded sequentially on purpose. This runs while flytekit itself is still being imported, and plugins
+    # import flytekit, so loading them from worker threads would block on the flytekit module lock held by this thread.
     for p in discovered_plugins:
         p.load()
 
 
+def _rich_excepthook(exc_type, exc_value, exc_traceback):
+    """
+    Pretty-prints unhandled exceptions the same way ``rich.traceback.install`` does. ``rich`` is only imported, and the
+    console only set up, when there is actually something to print.
+    """
+    from rich.console import Console
+    from rich.traceback import Traceback
+
+    Console(stderr=True).print(Traceback.from_exception(exc_type, exc_value, exc_traceback, width=None, extra_lines=0))
+
+
 # Load all implicit plugins
 load_implicit_plugins()
 
 # Pretty-print exception messages
 if os.environ.get(LOGGING_RICH_FMT_ENV_VAR) != "0":
-    traceback.install(width=None, extra_lines=0)
+    # IPython is only consulted when it is already loaded, importing it just to find out would be expensive.
+    if "IPython" in sys.modules and sys.modules["IPython"].get_ipython() is not None:
+        # IPython does not go through sys.excepthook, rich has to register its handler with the shell up front.
+        from rich import traceback
+
+        traceback.install(width=None, extra_lines=0)
+    else:
+        sys.excepthook = _rich_excepthook
@@ -7,19 +7,24 @@ def get_function_param_location(func: typing.Callable, param_name: str) -> (int,
     """
     Get the line and column number of the parameter in the source code of the function definition.
     """
-    # Get source code of the function
     source_lines, start_line = inspect.getsourcelines(func)
-    source_code = "".join(source_lines)
+    return find_function_param_location(source_lines, start_line, func.__name__, param_name)
 
-    # Parse the source code into an AST
-    module = ast.parse(source_code)
 
-    # Traverse the AST to find the function definition
-    for node in ast.walk(module):
-        if isinstance(node, ast.FunctionDef) and node.name == func.__name__:
-            for i, arg in enumerate(node.args.args):
+def find_function_param_location(
+    source_lines: typing.List[str], start_line: int, func_name: str, param_name: str
+) -> typing.Optional[typing.Tuple[int, int]]:
+    """
+    Same as get_function_param_location, but works on source lines already returned by inspect.getsourcelines.
+    """
+    module = ast.parse("".join(source_lines))
+    # The source returned by inspect is the function definition itself, so it is found at the top level of the module
+    for node in module.body:
+        if isinstance(node, ast.FunctionDef) and node.name == func_name:
+            for arg in node.args.args:
                 if arg.arg == param_name:
                     # Calculate the line and column number of the parameter
                     line_number = start_line + node.lineno - 1
                     column_offset = arg.col_offset
                     return line_number, column_offset
+    return None
@@ -76,19 +76,21 @@ def _compute_array_job_index():
 
 def _get_working_loop():
     """Returns a running event loop."""
-    try:
-        return asyncio.get_running_loop()
-    except RuntimeError:
-        with warnings.catch_warnings():
-            warnings.simplefilter("error", DeprecationWarning)
-            try:
-                return asyncio.get_event_loop_policy().get_event_loop()
-            # Since version 3.12, DeprecationWarning is emitted if there is no
-            # current event loop.
-            except DeprecationWarning:
-                loop = asyncio.get_event_loop_policy().new_event_loop()
-                asyncio.set_event_loop(loop)
-                return loop
+    # Unlike get_running_loop, this returns None instead of raising when no loop is running, which is the common case
+    # when dispatching a task.
+    loop = asyncio._get_running_loop()
+    if loop is not None:
+        return loop
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return asyncio.get_event_loop_policy().get_event_loop()
+        # Since version 3.12, DeprecationWarning is emitted if there is no
+        # current event loop.
+        except DeprecationWarning:
+            loop = asyncio.get_event_loop_policy().new_event_loop()
+            asyncio.set_event_loop(loop)
+            return loop
 
 
 def _dispatch_execute(
@@ -1,33 +1,74 @@
+import importlib
 import os
 import typing
 
 import rich_click as click
 
 from flytekit import configuration
-from flytekit.clis.sdk_in_container.backfill import backfill
-from flytekit.clis.sdk_in_container.build import build
 from flytekit.clis.sdk_in_container.constants import CTX_CONFIG_FILE, CTX_PACKAGES, CTX_VERBOSE
-from flytekit.clis.sdk_in_container.executions import execute
-from flytekit.clis.sdk_in_container.fetch import fetch
-from flytekit.clis.sdk_in_container.get import get
-from flytekit.clis.sdk_in_container.init import init
-from flytekit.clis.sdk_in_container.launchplan import launchplan
-from flytekit.clis.sdk_in_container.local_cache import local_cache
-from flytekit.clis.sdk_in_container.metrics import metrics
-from flytekit.clis.sdk_in_container.package import package
-from flytekit.clis.sdk_in_container.register import register
-from flytekit.clis.sdk_in_container.run import run
-from flytekit.clis.sdk_in_container.serialize import serialize
-from flytekit.clis.sdk_in_container.serve import serve
 from flytekit.clis.sdk_in_container.utils import ErrorHandlingCommand, validate_package
-from flytekit.clis.version import info
 from flytekit.configuration.file import FLYTECTL_CONFIG_ENV_VAR, FLYTECTL_CONFIG_ENV_VAR_OVERRIDE
 from flytekit.configuration.internal import LocalSDK
-from flytekit.configuration.plugin import get_plugin
+from flytekit.configuration.plugin import FlytekitPlugin, get_plugin
 from flytekit.loggers import logger
 
+# Maps each subcommand name to the module and attribute that define it. The modules are only imported when the
+# subcommand is used, so e.g. ``pyflyte run`` does not pay for importing grpc for ``serve``.
+_LAZY_SUBCOMMANDS: typing.Dict[str, typing.Tuple[str, str]] = {
+    "serialize": ("flytekit.clis.sdk_in_container.serialize", "serialize"),
+    "package": ("flytekit.clis.sdk_in_container.package", "package"),
+    "local-cache": ("flytekit.clis.sdk_in_container.local_cache", "local_cache"),
+    "init": ("flytekit.clis.sdk_in_container.init", "init"),
+    "run": ("flytekit.clis.sdk_in_container.run", "run"),
+    "register": ("flytekit.clis.sdk_in_container.register", "register"),
+    "backfill": ("flytekit.clis.sdk_in_container.backfill", "backfill"),
+    "serve": ("flytekit.clis.sdk_in_container.serve", "serve"),
+    "build": ("flytekit.clis.sdk_in_container.build", "build"),
+    "metrics": ("flytekit.clis.sdk_in_container.metrics", "metrics"),
+    "launchplan": ("flytekit.clis.sdk_in_container.launchplan", "launchplan"),
+    "fetch": ("flytekit.clis.sdk_in_container.fetch", "fetch"),
+    "info": ("flytekit.clis.version", "info"),
+    "get": ("flytekit.clis.sdk_in_container.get", "get"),
+    "execution": ("flytekit.clis.sdk_in_container.executions", "execute"),
+}
 
-@click.group("pyflyte", invoke_without_command=True, cls=ErrorHandlingCommand)
+
+class LazySubcommandGroup(ErrorHandlingCommand):
+    """
+    Group that imports the modules of its subcommands on first use, instead of when the group is created.
+    Commands added with ``add_command`` take precedence over lazy ones with the same name.
+    """
+
+    def __init__(
+        self, *args, lazy_subcommands: typing.Optional[typing.Dict[str, typing.Tuple[str, str]]] = None, **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> typing.List[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> typing.Optional[click.Command]:
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            self._load_lazy_subcommand(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_lazy_subcommand(self, cmd_name: str):
+        module_name, attr = self.lazy_subcommands[cmd_name]
+        self.add_command(getattr(importlib.import_module(module_name), attr), cmd_name)
+
+    def load_lazy_subcommands(self):
+        """
+        Adds all the lazy subcommands to ``commands``, for code that needs to see or modify every subcommand. Afterwards
+        the group behaves like a regular group, e.g. a command removed from ``commands`` stays removed.
+        """
+        for cmd_name in self.lazy_subcommands:
+            if cmd_name not in self.commands:
+                self._load_lazy_subcommand(cmd_name)
+        self.lazy_subcommands = {}
+
+
+@click.group("pyflyte", invoke_without_command=True, cls=LazySubcommandGroup, lazy_subcommands=_LAZY_SUBCOMMANDS)
 @click.option(
     "-v",
     "--verbose",
@@ -81,24 +122,15 @@ def main(ctx, pkgs: typing.List[str], config: str, verbose: int):
     ctx.obj[CTX_VERBOSE] = verbose
 
 
-main.add_command(serialize)
-main.add_command(package)
-main.add_command(local_cache)
-main.add_command(init)
-main.add_command(run)
-main.add_command(register)
-main.add_command(backfill)
-main.add_command(serve)
-main.add_command(build)
-main.add_command(metrics)
-main.add_command(launchplan)
-main.add_command(fetch)
-main.add_command(info)
-main.add_command(get)
-main.add_command(execute)
-main.epilog
-
-get_plugin().configure_pyflyte_cli(main)
+def _configure_pyflyte_cli(group: LazySubcommandGroup):
+    plugin = get_plugin()
+    if plugin.configure_pyflyte_cli is not FlytekitPlugin.configure_pyflyte_cli:
+        # Plugins may wrap, replace or remove the built-in commands, so they have to see all of them
+        group.load_lazy_subcommands()
+        plugin.configure_pyflyte_cli(group)
+
+
+_configure_pyflyte_cli(main)
 
 if __name__ == "__main__":
     main()
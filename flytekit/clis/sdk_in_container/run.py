@@ -382,12 +382,7 @@ class Entities(typing.NamedTuple):
     launch_plans: typing.List[typing.Tuple[str, str]]  # LP is stored as a tuple of name, the variable name in the file
 
     def all(self) -> typing.List[str]:
-        e = []
-        e.extend(self.workflows)
-        e.extend(self.tasks)
-        for i in self.launch_plans:
-            e.append(i[0])
-        return e
+        return [*self.workflows, *self.tasks, *(i[0] for i in self.launch_plans)]
 
     def matching_lp(self, lp_name: str) -> typing.Optional[str]:
         """
@@ -1020,13 +1015,13 @@ class WorkflowCommand(click.RichGroup):
             self._filename = pathlib.Path(filename).resolve()
             self._should_delete = False
         self._entities: typing.Optional[Entities] = None
+        self._entity_names: typing.Optional[typing.List[str]] = None
 
     def list_commands(self, ctx):
-        if self._entities:
-            return self._entities.all()
-        entities = get_entities_in_file(self._filename, self._should_delete)
-        self._entities = entities
-        return entities.all()
+        if self._entity_names is None:
+            self._entities = get_entities_in_file(self._filename, self._should_delete)
+            self._entity_names = self._entities.all()
+        return self._entity_names
 
     def _create_command(
         self,
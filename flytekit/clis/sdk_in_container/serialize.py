@@ -55,15 +55,18 @@ def serialize_all(
     :param flytekit_virtualenv_root: The full path of the virtual env in the container.
     """
 
-    if not (mode == SerializationMode.DEFAULT or mode == SerializationMode.FAST):
+    if mode is not SerializationMode.DEFAULT and mode is not SerializationMode.FAST:
         raise AssertionError(f"Unrecognized serialization mode: {mode}")
 
     serialization_settings = SerializationSettings(
         image_config=image_config or ImageConfig.auto(config_file),
+        # Disabled fast serialization settings are equivalent to none at all, only build them in fast mode.
         fast_serialization_settings=FastSerializationSettings(
-            enabled=mode == SerializationMode.FAST,
+            enabled=True,
             # TODO: if we want to move the destination dir as a serialization argument, we should initialize it here
-        ),
+        )
+        if mode is SerializationMode.FAST
+        else None,
         flytekit_virtualenv_root=flytekit_virtualenv_root,
         python_interpreter=python_interpreter,
         env=env,
@@ -147,7 +150,7 @@ def serialize(
 
     if in_container_virtualenv_root:
         ctx.obj[CTX_FLYTEKIT_VIRTUALENV_ROOT] = in_container_virtualenv_root
-        ctx.obj[CTX_PYTHON_INTERPRETER] = os.path.join(in_container_virtualenv_root, "/bin/python3")
+        ctx.obj[CTX_PYTHON_INTERPRETER] = os.path.join(in_container_virtualenv_root, "bin", "python3")
     else:
         # For in container serialize we make sure to never accept an override the entrypoint path and determine it here
         # instead.
@@ -168,10 +171,10 @@ def workflows(ctx, folder=None):
         click.echo(f"Writing output to {folder}")
 
     pkgs = ctx.obj[CTX_PACKAGES]
-    dir = ctx.obj[CTX_LOCAL_SRC_ROOT]
+    src_dir = ctx.obj[CTX_LOCAL_SRC_ROOT]
     serialize_all(
         pkgs,
-        dir,
+        src_dir,
         folder,
         SerializationMode.DEFAULT,
         image_config=ctx.obj[CTX_IMAGE],
@@ -207,10 +210,9 @@ def fast_workflows(ctx, folder=None, deref_symlinks=False):
     click.echo(f"Wrote compressed archive to {archive_fname}")
 
     pkgs = ctx.obj[CTX_PACKAGES]
-    dir = ctx.obj[CTX_LOCAL_SRC_ROOT]
     serialize_all(
         pkgs,
-        dir,
+        source_dir,
         folder,
         SerializationMode.FAST,
         image_config=ctx.obj[CTX_IMAGE],
@@ -413,8 +413,8 @@ class SecretsManager(object):
         group_version: Optional[str] = None,
         env_prefix: str = "",
     ):
-        l = [k.upper() for k in filter(None, (group, group_version, key))]
-        return f"{env_prefix}{'_'.join(l)}"
+        # Upper casing the joined name once is equivalent to upper casing each part, with fewer intermediate strings
+        return f"{env_prefix}{'_'.join(filter(None, (group, group_version, key))).upper()}"
 
     def get_secrets_file(
         self, group: Optional[str] = None, key: Optional[str] = None, group_version: Optional[str] = None
@@ -895,7 +895,7 @@ class FlyteContextManager(object):
         flyte_context_Var.set(context_list)
         t = "\t"
         developer_logger.debug(
-            f"{t * ctx.level}[{len(flyte_context_Var.get())}] Pushing context - {'compile' if ctx.compilation_state else 'execute'}, branch[{ctx.in_a_condition}], {ctx.get_origin_stackframe_repr()}"
+            f"{t * ctx.level}[{len(context_list)}] Pushing context - {'compile' if ctx.compilation_state else 'execute'}, branch[{ctx.in_a_condition}], {ctx.get_origin_stackframe_repr()}"
         )
         return ctx
 
@@ -906,9 +906,9 @@ class FlyteContextManager(object):
         flyte_context_Var.set(context_list)
         t = "\t"
         developer_logger.debug(
-            f"{t * ctx.level}[{len(flyte_context_Var.get()) + 1}] Popping context - {'compile' if ctx.compilation_state else 'execute'}, branch[{ctx.in_a_condition}], {ctx.get_origin_stackframe_repr()}"
+            f"{t * ctx.level}[{len(context_list) + 1}] Popping context - {'compile' if ctx.compilation_state else 'execute'}, branch[{ctx.in_a_condition}], {ctx.get_origin_stackframe_repr()}"
         )
-        if len(flyte_context_Var.get()) == 0:
+        if len(context_list) == 0:
             raise AssertionError(f"Illegal Context state! Popped, {ctx}")
         return ctx
 
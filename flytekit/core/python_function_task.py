@@ -19,10 +19,9 @@ from __future__ import annotations
 
 import inspect
 from abc import ABC
-from collections import OrderedDict
 from contextlib import suppress
 from enum import Enum
-from typing import Any, Callable, Iterable, List, Optional, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional, TypeVar, Union, cast
 
 from flytekit.core import launch_plan as _annotated_launch_plan
 from flytekit.core.base_task import Task, TaskResolverMixin
@@ -39,15 +38,35 @@ from flytekit.core.workflow import (
     WorkflowMetadata,
     WorkflowMetadataDefaults,
 )
+from flytekit.deck import Deck, DeckField
+from flytekit.deck.renderer import PythonDependencyRenderer, SourceCodeRenderer
 from flytekit.exceptions.user import FlyteValueException
 from flytekit.loggers import logger
 from flytekit.models import dynamic_job as _dynamic_job
 from flytekit.models import literals as _literal_models
 from flytekit.models import task as task_models
-from flytekit.models.admin import workflow as admin_workflow_models
+
+if TYPE_CHECKING:
+    from flytekit.models.admin import workflow as admin_workflow_models
 
 T = TypeVar("T")
 
+_python_dependencies_html_cache: Optional[str] = None
+
+
+def _python_dependencies_html() -> str:
+    """
+    Listing the installed packages runs pip in a subprocess. The installed packages do not change while a process runs
+    tasks, so the rendered deck is computed once per process. Failures are not cached, as they may be transient.
+    """
+    global _python_dependencies_html_cache
+    if _python_dependencies_html_cache is None:
+        html = PythonDependencyRenderer().to_html()
+        if html == PythonDependencyRenderer.FETCH_ERROR_HTML:
+            return html
+        _python_dependencies_html_cache = html
+    return _python_dependencies_html_cache
+
 
 class PythonInstanceTask(PythonAutoContainerTask[T], ABC):  # type: ignore
     """
@@ -150,8 +169,8 @@ class PythonFunctionTask(PythonAutoContainerTask[T]):  # type: ignore
             # The default task resolver can't handle nested functions
             # TODO: Consider moving this to a can_handle function or something inside the resolver itself.
             if (
-                not istestfunction(func=task_function)
-                and isnested(func=task_function)
+                isnested(func=task_function)
+                and not istestfunction(func=task_function)
                 and not is_functools_wrapped_module_level(task_function)
             ):
                 raise ValueError(
@@ -171,6 +190,8 @@ class PythonFunctionTask(PythonAutoContainerTask[T]):  # type: ignore
                 "workflows its redundant because flyte can find the node dependencies automatically"
             )
         self._wf = None  # For dynamic tasks
+        self._source_code_html: Optional[str] = None
+        self._expected_output_names = tuple(self.python_interface.outputs.keys())
 
     @property
     def execution_mode(self) -> ExecutionBehavior:
@@ -191,8 +212,9 @@ class PythonFunctionTask(PythonAutoContainerTask[T]):  # type: ignore
         """
         Returns the name of the task.
         """
-        if self.instantiated_in and self.instantiated_in not in self._name:
-            return f"{self.instantiated_in}.{self._name}"
+        instantiated_in = self.instantiated_in
+        if instantiated_in and instantiated_in not in self._name:
+            return f"{instantiated_in}.{self._name}"
         return self._name
 
     def execute(self, **kwargs) -> Any:
@@ -213,9 +235,8 @@ class PythonFunctionTask(PythonAutoContainerTask[T]):  # type: ignore
     def _create_and_cache_dynamic_workflow(self):
         if self._wf is None:
             workflow_meta = WorkflowMetadata(on_failure=WorkflowFailurePolicy.FAIL_IMMEDIATELY)
-            defaults = WorkflowMetadataDefaults(
-                interruptible=self.metadata.interruptible if self.metadata.interruptible is not None else False
-            )
+            interruptible = self.metadata.interruptible
+            defaults = WorkflowMetadataDefaults(interruptible=interruptible if interruptible is not None else False)
             self._wf = PythonFunctionWorkflow(self._task_function, metadata=workflow_meta, default_metadata=defaults)
 
     def compile_into_workflow(
@@ -246,7 +267,7 @@ class PythonFunctionTask(PythonAutoContainerTask[T]):  # type: ignore
             cast(PythonFunctionWorkflow, self._wf).compile(**kwargs)
 
             wf = self._wf
-            model_entities: OrderedDict = OrderedDict()
+            model_entities: dict = {}
             # See comment on reference entity checking a bit down below in this function.
             # This is the only circular dependency between the translator.py module and the rest of the flytekit
             # authoring experience.
@@ -263,11 +284,10 @@ class PythonFunctionTask(PythonAutoContainerTask[T]):  # type: ignore
             )
 
             # If no nodes were produced, let's just return the strict outputs
-            if len(workflow_spec.template.nodes) == 0:
+            template = workflow_spec.template
+            if not template.nodes:
                 return _literal_models.LiteralMap(
-                    literals={
-                        binding.var: binding.binding.to_literal_model() for binding in workflow_spec.template.outputs
-                    }
+                    literals={binding.var: binding.binding.to_literal_model() for binding in template.outputs}
                 )
 
             # Gather underlying TaskTemplates that get referenced.
@@ -275,7 +295,7 @@ class PythonFunctionTask(PythonAutoContainerTask[T]):  # type: ignore
             for entity, model in model_entities.items():
                 # We only care about gathering tasks here. Launch plans are handled by
                 # propeller. Subworkflows should already be in the workflow spec.
-                if not isinstance(entity, Task) and not isinstance(entity, task_models.TaskSpec):
+                if not isinstance(entity, (Task, task_models.TaskSpec)):
                     continue
 
                 # We are currently not supporting reference tasks since these will
@@ -294,10 +314,10 @@ class PythonFunctionTask(PythonAutoContainerTask[T]):  # type: ignore
                 tts.append(model.template)
 
             dj_spec = _dynamic_job.DynamicJobSpec(
-                min_successes=len(workflow_spec.template.nodes),
+                min_successes=len(template.nodes),
                 tasks=tts,
-                nodes=workflow_spec.template.nodes,
-                outputs=workflow_spec.template.outputs,
+                nodes=template.nodes,
+                outputs=template.outputs,
                 subworkflows=workflow_spec.sub_workflows,
             )
 
@@ -321,21 +341,22 @@ class PythonFunctionTask(PythonAutoContainerTask[T]):  # type: ignore
             # local_execute directly though since that converts inputs into Promises.
             logger.debug(f"Executing Dynamic workflow, using raw inputs {kwargs}")
             self._create_and_cache_dynamic_workflow()
+            wf = cast(PythonFunctionWorkflow, self._wf)
             if self.execution_mode == self.ExecutionBehavior.DYNAMIC:
                 es = ctx.new_execution_state().with_params(mode=ExecutionState.Mode.DYNAMIC_TASK_EXECUTION)
             else:
                 es = cast(ExecutionState, ctx.execution_state)
             with FlyteContextManager.with_context(ctx.with_execution_state(es)):
-                function_outputs = cast(PythonFunctionWorkflow, self._wf).execute(**kwargs)
+                function_outputs = wf.execute(**kwargs)
 
             if isinstance(function_outputs, VoidPromise) or function_outputs is None:
                 return VoidPromise(self.name)
 
-            if len(cast(PythonFunctionWorkflow, self._wf).python_interface.outputs) == 0:
+            if len(wf.python_interface.outputs) == 0:
                 raise FlyteValueException(function_outputs, "Interface output should've been VoidPromise or None.")
 
             # TODO: This will need to be cleaned up when we revisit top-level tuple support.
-            expected_output_names = list(self.python_interface.outputs.keys())
+            expected_output_names = self._expected_output_names
             if len(expected_output_names) == 1:
                 # Here we have to handle the fact that the wf could've been declared with a typing.NamedTuple of
                 # length one. That convention is used for naming outputs - and single-length-NamedTuples are
@@ -346,9 +367,7 @@ class PythonFunctionTask(PythonAutoContainerTask[T]):  # type: ignore
                 else:
                     wf_outputs_as_map = {expected_output_names[0]: function_outputs}
             else:
-                wf_outputs_as_map = {
-                    expected_output_names[i]: function_outputs[i] for i, _ in enumerate(function_outputs)
-                }
+                wf_outputs_as_map = dict(zip(expected_output_names, function_outputs))
 
             # In a normal workflow, we'd repackage the promises coming from tasks into new Promises matching the
             # workflow's interface. For a dynamic workflow, just return the literal map.
@@ -370,22 +389,20 @@ class PythonFunctionTask(PythonAutoContainerTask[T]):  # type: ignore
 
     def _write_decks(self, native_inputs, native_outputs_as_map, ctx, new_user_params):
         if self._disable_deck is False:
-            from flytekit.deck import Deck, DeckField
-            from flytekit.deck.renderer import PythonDependencyRenderer
-
-            # These errors are raised if the source code can not be retrieved
-            with suppress(OSError, TypeError):
-                source_code = inspect.getsource(self._task_function)
-                from flytekit.deck.renderer import SourceCodeRenderer
-
-                if DeckField.SOURCE_CODE in self.deck_fields:
+            if DeckField.SOURCE_CODE in self.deck_fields:
+                # The source of the task function does not change, so it is only retrieved and rendered once
+                if self._source_code_html is None:
+                    # These errors are raised if the source code can not be retrieved
+                    with suppress(OSError, TypeError):
+                        source_code = inspect.getsource(self._task_function)
+                        self._source_code_html = SourceCodeRenderer().to_html(source_code)
+
+                if self._source_code_html is not None:
                     source_code_deck = Deck(DeckField.SOURCE_CODE.value)
-                    renderer = SourceCodeRenderer()
-                    source_code_deck.append(renderer.to_html(source_code))
+                    source_code_deck.append(self._source_code_html)
 
             if DeckField.DEPENDENCIES in self.deck_fields:
                 python_dependencies_deck = Deck(DeckField.DEPENDENCIES.value)
-                renderer = PythonDependencyRenderer()
-                python_dependencies_deck.append(renderer.to_html())
+                python_dependencies_deck.append(_python_dependencies_html())
 
         return super()._write_decks(native_inputs, native_outputs_as_map, ctx, new_user_params)
@@ -274,6 +274,7 @@ class _ModuleSanitizer(object):
 
     def __init__(self):
         self._module_cache = {}
+        self._absolute_module_cache: typing.Dict[typing.Tuple[str, typing.Optional[str]], str] = {}
 
     def _resolve_abs_module_name(self, path: str, package_root: typing.Optional[str] = None) -> str:
         """
@@ -325,7 +326,11 @@ class _ModuleSanitizer(object):
         Returns the absolute module path for a given python file path. This assumes that every module correctly contains
         a __init__.py file. Absence of this file, indicates the root.
         """
-        return self._resolve_abs_module_name(path, package_root)
+        # Every task defined in the same file resolves the same path, so the directory walk is only done once per file
+        key = (path, package_root)
+        if key not in self._absolute_module_cache:
+            self._absolute_module_cache[key] = self._resolve_abs_module_name(path, package_root)
+        return self._absolute_module_cache[key]
 
 
 _mod_sanitizer = _ModuleSanitizer()
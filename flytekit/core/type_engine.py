@@ -65,6 +65,47 @@ def _default_msgpack_decoder(data: bytes) -> Any:
     return msgpack.unpackb(data, strict_map_key=False)
 
 
+_packer_tls = threading.local()
+
+
+def _msgpack_dumps(obj: Any) -> bytes:
+    """
+    Same as msgpack.dumps, but reuses a Packer per thread instead of building a new one, with its buffer, on every call.
+    Packers are not thread safe, hence the thread local.
+    """
+    try:
+        packer = _packer_tls.packer
+    except AttributeError:
+        packer = msgpack.Packer()
+        _packer_tls.packer = packer
+    return packer.pack(obj)
+
+
+def _batch_decode_untyped_dicts(literals: typing.List[Literal]) -> Optional[typing.List[dict]]:
+    """
+    Decodes a list of msgpack binary literals holding untyped dicts in a single pass of the C unpacker, instead of
+    converting every literal through the type engine. Returns None if any literal is not a msgpack binary, or does not
+    decode to a dict, in which case the literals should be converted one by one.
+    """
+    payloads = []
+    for lit in literals:
+        binary = lit.scalar.binary if lit.scalar is not None else None
+        if binary is None or binary.tag != MESSAGEPACK:
+            return None
+        payloads.append(binary.value)
+
+    blob = b"".join(payloads)
+    unpacker = msgpack.Unpacker(strict_map_key=False, max_buffer_size=max(len(blob), 1))
+    unpacker.feed(blob)
+    try:
+        values = list(unpacker)
+    except ValueError:
+        return None
+    if len(values) != len(payloads) or not all(type(v) is dict for v in values):
+        return None
+    return values
+
+
 class BatchSize:
     """
     This is used to annotate a FlyteDirectory when we want to download/upload the contents of the directory in batches. For example,
@@ -305,14 +346,10 @@ class AsyncTypeTransformer(TypeTransformer[T]):
     def to_literal(
         self, ctx: FlyteContext, python_val: typing.Any, python_type: Type[T], expected: LiteralType
     ) -> Literal:
-        synced = loop_manager.synced(self.async_to_literal)
-        result = synced(ctx, python_val, python_type, expected)
-        return result
+        return loop_manager.run_sync(self.async_to_literal, ctx, python_val, python_type, expected)
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]) -> Optional[T]:
-        synced = loop_manager.synced(self.async_to_python_value)
-        result = synced(ctx, lv, expected_python_type)
-        return result
+        return loop_manager.run_sync(self.async_to_python_value, ctx, lv, expected_python_type)
 
 
 class SimpleTransformer(TypeTransformer[T]):
@@ -707,7 +744,7 @@ class DataclassTransformer(TypeTransformer[object]):
             return self.to_generic_literal(ctx, python_val, python_type, expected)
 
         if isinstance(python_val, dict):
-            msgpack_bytes = msgpack.dumps(python_val)
+            msgpack_bytes = _msgpack_dumps(python_val)
             return Literal(scalar=Scalar(binary=Binary(value=msgpack_bytes, tag=MESSAGEPACK)))
 
         if not dataclasses.is_dataclass(python_val):
@@ -724,7 +761,7 @@ class DataclassTransformer(TypeTransformer[object]):
         if isinstance(python_val, DataClassJSONMixin):
             json_str = python_val.to_json()
             dict_obj = json.loads(json_str)
-            msgpack_bytes = msgpack.dumps(dict_obj)
+            msgpack_bytes = _msgpack_dumps(dict_obj)
         else:
             # The function looks up or creates a MessagePackEncoder specifically designed for the object's type.
             # This encoder is then used to convert a data class into MessagePack Bytes.
@@ -1150,6 +1187,13 @@ class TypeEngine(typing.Generic[T]):
     @classmethod
     def _get_transformer(cls, python_type: Type) -> Optional[TypeTransformer[T]]:
         cls.lazy_import_transformers()
+        if type(python_type) is type:
+            # Fast path for plain classes such as int, str or datetime. Enums have their own metaclass, so they never
+            # take this path.
+            v = cls._REGISTRY.get(python_type)
+            if v is not None:
+                return v
+
         if is_annotated(python_type):
             args = get_args(python_type)
             for annotation in args:
@@ -1353,8 +1397,7 @@ class TypeEngine(typing.Generic[T]):
             transformer.assert_type(python_type, python_val)
 
         if isinstance(transformer, AsyncTypeTransformer):
-            synced = loop_manager.synced(transformer.async_to_literal)
-            lv = synced(ctx, python_val, python_type, expected)
+            lv = loop_manager.run_sync(transformer.async_to_literal, ctx, python_val, python_type, expected)
         else:
             lv = transformer.to_literal(ctx, python_val, python_type, expected)
 
@@ -1409,13 +1452,11 @@ class TypeEngine(typing.Generic[T]):
         """
         # Initiate the process of loading the offloaded literal if offloaded_metadata is set
         if lv.offloaded_metadata:
-            synced = loop_manager.synced(cls.unwrap_offloaded_literal)
-            lv = synced(ctx, lv)
+            lv = loop_manager.run_sync(cls.unwrap_offloaded_literal, ctx, lv)
         transformer = cls.get_transformer(expected_python_type)
 
         if isinstance(transformer, AsyncTypeTransformer):
-            synced = loop_manager.synced(transformer.async_to_python_value)
-            return synced(ctx, lv, expected_python_type)
+            return loop_manager.run_sync(transformer.async_to_python_value, ctx, lv, expected_python_type)
         else:
             res = transformer.to_python_value(ctx, lv, expected_python_type)
             return res
@@ -1463,8 +1504,7 @@ class TypeEngine(typing.Generic[T]):
         python_types: typing.Optional[typing.Dict[str, type]] = None,
         literal_types: typing.Optional[typing.Dict[str, _interface_models.Variable]] = None,
     ) -> typing.Dict[str, typing.Any]:
-        synced = loop_manager.synced(cls._literal_map_to_kwargs)
-        return synced(ctx, lm, python_types, literal_types)
+        return loop_manager.run_sync(cls._literal_map_to_kwargs, ctx, lm, python_types, literal_types)
 
     @classmethod
     @timeit("AsyncTranslate literal to python value")
@@ -1517,8 +1557,7 @@ class TypeEngine(typing.Generic[T]):
         d: typing.Dict[str, typing.Any],
         type_hints: Optional[typing.Dict[str, type]] = None,
     ) -> LiteralMap:
-        synced = loop_manager.synced(cls._dict_to_literal_map)
-        return synced(ctx, d, type_hints)
+        return loop_manager.run_sync(cls._dict_to_literal_map, ctx, d, type_hints)
 
     @classmethod
     async def _dict_to_literal_map(
@@ -1683,6 +1722,11 @@ class ListTransformer(AsyncTypeTransformer[T]):
             )
 
         st = self.get_sub_type(expected_python_type)
+        if st is dict and lits:
+            values = _batch_decode_untyped_dicts(lits)
+            if values is not None:
+                return values  # type: ignore
+
         result = [TypeEngine.async_to_python_value(ctx, x, st) for x in lits]
         result = await _run_coros_in_chunks(result)
         return result  # type: ignore  # should be a list, thinks its a tuple
@@ -1974,6 +2018,10 @@ class UnionTransformer(AsyncTypeTransformer[T]):
         raise ValueError(f"Union transformer cannot reverse {literal_type}")
 
 
+# Same as the per-transformer _msgpack_encoder dicts, for the static DictTransformer.dict_to_binary_literal
+_dict_msgpack_encoder: Dict[Type, MessagePackEncoder] = dict()
+
+
 class DictTransformer(AsyncTypeTransformer[dict]):
     """
     Transformer that transforms an univariate dictionary Dict[str, T] to a Literal Map or
@@ -2050,7 +2098,11 @@ class DictTransformer(AsyncTypeTransformer[dict]):
 
         try:
             # Handle dictionaries with non-string keys (e.g., Dict[int, Type])
-            encoder = MessagePackEncoder(python_type)
+            try:
+                encoder = _dict_msgpack_encoder[python_type]
+            except KeyError:
+                encoder = MessagePackEncoder(python_type)
+                _dict_msgpack_encoder[python_type] = encoder
             msgpack_bytes = encoder.encode(v)
             return Literal(scalar=Scalar(binary=Binary(value=msgpack_bytes, tag=MESSAGEPACK)))
         except TypeError as e:
@@ -2201,7 +2253,7 @@ class DictTransformer(AsyncTypeTransformer[dict]):
                 """
 
                 dict_obj = json.loads(_json_format.MessageToJson(lv.scalar.generic))
-                msgpack_bytes = msgpack.dumps(dict_obj)
+                msgpack_bytes = _msgpack_dumps(dict_obj)
 
                 try:
                     decoder = self._msgpack_decoder[expected_python_type]
@@ -93,6 +93,9 @@ class PythonDependencyRenderer:
     PythonDependencyDeck is a deck that contains information about packages installed via pip.
     """
 
+    # Returned by to_html when the installed packages cannot be listed
+    FETCH_ERROR_HTML = "Error occurred while fetching installed packages."
+
     def __init__(self, title: str = "Dependencies"):
         self._title = title
 
@@ -115,7 +118,7 @@ class PythonDependencyRenderer:
             )
         except Exception as e:
             logger.error(f"Error occurred while fetching installed packages: {e}")
-            return "Error occurred while fetching installed packages."
+            return self.FETCH_ERROR_HTML
 
         table = (
             "<table>\n<tr>\n<th style='text-align:left;'>Name</th>\n<th style='text-align:left;'>Version</th>\n</tr>\n"
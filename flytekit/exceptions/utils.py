@@ -1,7 +1,7 @@
 import inspect
 import typing
 
-from flytekit._ast.parser import get_function_param_location
+from flytekit._ast.parser import find_function_param_location
 from flytekit.core.constants import SOURCE_CODE
 from flytekit.exceptions.user import FlyteUserException
 
@@ -12,11 +12,11 @@ def get_source_code_from_fn(fn: typing.Callable, param_name: typing.Optional[str
     """
     lines, start_line = inspect.getsourcelines(fn)
     if param_name is None:
-        return "".join(f"{start_line + i} {lines[i]}" for i in range(len(lines))), 0
+        return "".join([f"{line_no} {line}" for line_no, line in enumerate(lines, start_line)]), 0
 
-    target_line_no, column_offset = get_function_param_location(fn, param_name)
+    target_line_no, column_offset = find_function_param_location(lines, start_line, fn.__name__, param_name)
     line_index = target_line_no - start_line
-    source_code = "".join(f"{start_line + i} {lines[i]}" for i in range(line_index + 1))
+    source_code = "".join([f"{line_no} {line}" for line_no, line in enumerate(lines[: line_index + 1], start_line)])
     return source_code, column_offset
 
 
@@ -335,10 +335,9 @@ class AsyncAgentExecutorMixin:
         task_template = get_serializable(OrderedDict(), ss, self).template
         self._agent = AgentRegistry.get_agent(task_template.type, task_template.task_type_version)
 
-        resource_mata = asyncio.run(
-            self._create(task_template=task_template, output_prefix=output_prefix, inputs=kwargs)
+        resource = asyncio.run(
+            self._create_and_get(task_template=task_template, output_prefix=output_prefix, inputs=kwargs)
         )
-        resource = asyncio.run(self._get(resource_meta=resource_mata))
 
         if resource.phase != TaskExecution.SUCCEEDED:
             raise FlyteUserException(f"Failed to run the task {self.name} with error: {resource.message}")
@@ -355,6 +354,13 @@ class AsyncAgentExecutorMixin:
 
         return resource.outputs
 
+    async def _create_and_get(
+        self: PythonTask, task_template: TaskTemplate, output_prefix: str, inputs: Dict[str, Any] = None
+    ) -> Resource:
+        # Creating and polling the task share one event loop, instead of setting up and tearing down one for each.
+        resource_meta = await self._create(task_template=task_template, output_prefix=output_prefix, inputs=inputs)
+        return await self._get(resource_meta=resource_meta)
+
     async def _create(
         self: PythonTask, task_template: TaskTemplate, output_prefix: str, inputs: Dict[str, Any] = None
     ) -> ResourceMeta:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import gzip
 import hashlib
 import os
@@ -69,24 +70,61 @@ def print_ls_tree(source: os.PathLike, ls: typing.List[str]):
     rich_print(tree_root)
 
 
+@contextlib.contextmanager
+def _open_compressed_output(output: os.PathLike) -> typing.Iterator[typing.BinaryIO]:
+    """
+    Yields a stream whose contents are compressed into output, using pigz if available, otherwise gzip. The data is
+    written to a temporary file next to output, which only replaces output once the stream is complete, so a failure
+    never leaves a truncated archive behind.
+    """
+    tmp_output = f"{os.fspath(output)}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_output, "wb") as gzipped_file:
+            if pigz := shutil.which("pigz"):
+                proc = subprocess.Popen([pigz, "--no-time", "-c"], stdin=subprocess.PIPE, stdout=gzipped_file)
+                try:
+                    yield proc.stdin
+                finally:
+                    proc.stdin.close()
+                    returncode = proc.wait()
+                if returncode != 0:
+                    raise subprocess.CalledProcessError(returncode, proc.args)
+            else:
+                start_time = time.time()
+                with gzip.GzipFile(
+                    filename=os.path.basename(output), fileobj=gzipped_file, mode="wb", mtime=0
+                ) as gzipped:
+                    yield gzipped
+
+                end_time = time.time()
+                warning_time = 10
+                if end_time - start_time > warning_time:
+                    click.secho(
+                        f"Code tarball compression took {end_time - start_time:.0f} seconds. Consider installing `pigz` for faster compression.",
+                        fg="yellow",
+                    )
+        os.replace(tmp_output, output)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_output)
+        raise
+
+
 def compress_tarball(source: os.PathLike, output: os.PathLike) -> None:
     """Compress code tarball using pigz if available, otherwise gzip"""
-    if pigz := shutil.which("pigz"):
-        with open(output, "wb") as gzipped:
-            subprocess.run([pigz, "--no-time", "-c", source], stdout=gzipped, check=True)
-    else:
-        start_time = time.time()
-        with gzip.GzipFile(filename=output, mode="wb", mtime=0) as gzipped:
-            with open(source, "rb") as source_file:
-                gzipped.write(source_file.read())
+    with _open_compressed_output(output) as gzipped, open(source, "rb") as source_file:
+        shutil.copyfileobj(source_file, gzipped)
+
 
-        end_time = time.time()
-        warning_time = 10
-        if end_time - start_time > warning_time:
-            click.secho(
-                f"Code tarball compression took {end_time - start_time:.0f} seconds. Consider installing `pigz` for faster compression.",
-                fg="yellow",
-            )
+@contextlib.contextmanager
+def open_compressed_tarball(output: os.PathLike, deref_symlinks: bool = False) -> typing.Iterator[tarfile.TarFile]:
+    """
+    Opens a streaming tarball that is compressed while it is being written, see compress_tarball. Compressing the
+    stream directly avoids writing the uncompressed tarball to disk and reading it back.
+    """
+    with _open_compressed_output(output) as gzipped:
+        with tarfile.open(fileobj=gzipped, mode="w|", dereference=deref_symlinks) as tar:
+            yield tar
 
 
 def fast_package(
@@ -114,9 +152,6 @@ def fast_package(
         ignores = default_ignores
     ignore = IgnoreGroup(source, ignores)
 
-    # Remove this after original tar command is removed.
-    digest = compute_digest(source, ignore.is_ignored)
-
     # This function is temporarily split into two, to support the creation of the tar file in both the old way,
     # copying the underlying items in the source dir by doing a listdir, and the new way, relying on a list of files.
     if options and (
@@ -135,22 +170,21 @@ def fast_package(
             click.secho(f"No output path provided, using a temporary directory at {output_dir} instead", fg="yellow")
         archive_fname = os.path.join(output_dir, archive_fname)
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tar_path = os.path.join(tmp_dir, "tmp.tar")
-            with tarfile.open(tar_path, "w", dereference=deref_symlinks) as tar:
-                for ws_file in ls:
-                    rel_path = os.path.relpath(ws_file, start=source)
-                    tar.add(
-                        os.path.join(source, ws_file),
-                        recursive=False,
-                        arcname=rel_path,
-                        filter=lambda x: tar_strip_file_attributes(x),
-                    )
-
-            compress_tarball(tar_path, archive_fname)
+        with open_compressed_tarball(archive_fname, deref_symlinks) as tar:
+            for ws_file in ls:
+                rel_path = os.path.relpath(ws_file, start=source)
+                tar.add(
+                    os.path.join(source, ws_file),
+                    recursive=False,
+                    arcname=rel_path,
+                    filter=lambda x: tar_strip_file_attributes(x),
+                )
 
     # Original tar command - This condition to be removed in the future after serialize is removed.
     else:
+        # Only this path needs a separate digest walk, ls_files hashes the files while listing them.
+        digest = compute_digest(source, ignore.is_ignored)
+
         # Compute where the archive should be written
         archive_fname = f"{FAST_PREFIX}{digest}{FAST_FILEENDING}"
         if output_dir is None:
@@ -158,23 +192,35 @@ def fast_package(
             click.secho(f"No output path provided, using a temporary directory at {output_dir} instead", fg="yellow")
         archive_fname = os.path.join(output_dir, archive_fname)
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tar_path = os.path.join(tmp_dir, "tmp.tar")
-            with tarfile.open(tar_path, "w", dereference=deref_symlinks) as tar:
-                files: typing.List[str] = os.listdir(source)
-                for ws_file in files:
-                    tar.add(
-                        os.path.join(source, ws_file),
-                        arcname=ws_file,
-                        filter=lambda x: ignore.tar_filter(tar_strip_file_attributes(x)),
-                    )
-                # tar.list(verbose=True)
-
-            compress_tarball(tar_path, archive_fname)
+        with open_compressed_tarball(archive_fname, deref_symlinks) as tar:
+            for rel_path in _iter_included_paths(os.fspath(source), "", ignore, deref_symlinks):
+                tar.add(
+                    os.path.join(source, rel_path),
+                    recursive=False,
+                    arcname=rel_path,
+                    filter=lambda x: tar_strip_file_attributes(x),
+                )
+            # tar.list(verbose=True)
 
     return archive_fname
 
 
+def _iter_included_paths(root: str, rel_dir: str, ignore: Ignore, deref_symlinks: bool) -> typing.Iterator[str]:
+    """
+    Yields the paths under root, relative to it, that are not ignored. Parents are yielded before their children.
+    Entries are checked against the ignore rules before they are stat'ed, and ignored directories are not descended into.
+    """
+    with os.scandir(os.path.join(root, rel_dir)) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+        if ignore.is_ignored(rel_path):
+            continue
+        yield rel_path
+        if entry.is_dir(follow_symlinks=deref_symlinks):
+            yield from _iter_included_paths(root, rel_path, ignore, deref_symlinks)
+
+
 def compute_digest(source: Union[os.PathLike, List[os.PathLike]], filter: Optional[callable] = None) -> str:
     """
     Walks the entirety of the source dir to compute a deterministic md5 hex digest of the dir contents.
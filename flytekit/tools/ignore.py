@@ -1,16 +1,18 @@
 import os
+import re
 import subprocess
 import tarfile
 from abc import ABC, abstractmethod
-from fnmatch import fnmatch
+from fnmatch import translate
 from pathlib import Path
 from shutil import which
-from typing import Dict, List, Optional, Type
-
-from docker.utils.build import PatternMatcher
+from typing import TYPE_CHECKING, Dict, List, Optional, Type
 
 from flytekit.loggers import logger
 
+if TYPE_CHECKING:
+    from docker.utils.build import PatternMatcher
+
 STANDARD_IGNORE_PATTERNS = ["*.pyc", ".cache", ".cache/*", "__pycache__/*", "**/__pycache__/*"]
 
 
@@ -73,7 +75,10 @@ class DockerIgnore(Ignore):
         super().__init__(root)
         self.pm = self._parse()
 
-    def _parse(self) -> PatternMatcher:
+    def _parse(self) -> "PatternMatcher":
+        # docker is only needed once an ignore file is parsed, so importing it is deferred until then
+        from docker.utils.build import PatternMatcher
+
         patterns = []
         dockerignore = os.path.join(self.root, ".dockerignore")
         if os.path.isfile(dockerignore):
@@ -94,7 +99,9 @@ class FlyteIgnore(Ignore):
         super().__init__(root)
         self.pm = self._parse()
 
-    def _parse(self) -> PatternMatcher:
+    def _parse(self) -> "PatternMatcher":
+        from docker.utils.build import PatternMatcher
+
         patterns = []
         flyteignore = os.path.join(self.root, ".flyteignore")
         if os.path.isfile(flyteignore):
@@ -115,12 +122,11 @@ class StandardIgnore(Ignore):
     def __init__(self, root: Path, patterns: Optional[List[str]] = None):
         super().__init__(root)
         self.patterns = patterns if patterns else STANDARD_IGNORE_PATTERNS
+        # Equivalent to calling fnmatch with each pattern, but matches all of them in a single pass.
+        self._pattern = re.compile("|".join(f"(?:{translate(os.path.normcase(p))})" for p in self.patterns))
 
     def _is_ignored(self, path: str) -> bool:
-        for pattern in self.patterns:
-            if fnmatch(path, pattern):
-                return True
-        return False
+        return self._pattern.match(os.path.normcase(path)) is not None
 
 
 class IgnoreGroup(Ignore):
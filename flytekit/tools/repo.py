@@ -19,7 +19,11 @@ from flytekit.remote import FlyteRemote
 from flytekit.remote.remote import RegistrationSkipped, _get_git_repo_url
 from flytekit.tools import fast_registration, module_loader
 from flytekit.tools.script_mode import _find_project_root
-from flytekit.tools.serialize_helpers import get_registrable_entities, persist_registrable_entities
+from flytekit.tools.serialize_helpers import (
+    add_registrable_entities_to_tar,
+    get_registrable_entities,
+    persist_registrable_entities,
+)
 from flytekit.tools.translator import FlyteControlPlaneEntity, Options
 
 
@@ -42,10 +46,17 @@ def serialize_load_only(
     settings.source_root = local_source_root
     ctx_builder = FlyteContextManager.current_context().with_serialization_settings(settings)
     with FlyteContextManager.with_context(ctx_builder):
-        # Scan all modules. the act of loading populates the global singleton that contains all objects
-        with module_loader.add_sys_path(local_source_root):
-            click.secho(f"Loading packages {pkgs} under source root {local_source_root}", fg="yellow")
-            module_loader.just_load_modules(pkgs=pkgs)
+        _load_packages(pkgs, local_source_root)
+
+
+def _load_packages(pkgs: typing.List[str], local_source_root: typing.Optional[str] = None):
+    """
+    Loads the packages, expects to be called from within a context that carries the serialization settings.
+    """
+    # Scan all modules. the act of loading populates the global singleton that contains all objects
+    with module_loader.add_sys_path(local_source_root):
+        click.secho(f"Loading packages {pkgs} under source root {local_source_root}", fg="yellow")
+        module_loader.just_load_modules(pkgs=pkgs)
 
 
 def serialize_get_control_plane_entities(
@@ -82,8 +93,12 @@ def serialize_to_folder(
     """
     if folder is None:
         folder = "."
-    serialize_load_only(pkgs, settings, local_source_root)
-    loaded_entities = serialize_get_control_plane_entities(settings, local_source_root, options=options)
+    settings.source_root = local_source_root
+    # Loading and serializing share a single context, rather than building and pushing one for each step.
+    ctx_builder = FlyteContextManager.current_context().with_serialization_settings(settings)
+    with FlyteContextManager.with_context(ctx_builder) as ctx:
+        _load_packages(pkgs, local_source_root)
+        loaded_entities = get_registrable_entities(ctx, options=options)
     click.secho(
         f"Successfully serialized {len(loaded_entities)} flyte entities",
         fg="green",
@@ -114,8 +129,7 @@ def package(
         raise NoSerializableEntitiesError("Nothing to package")
 
     with tempfile.TemporaryDirectory() as output_tmpdir:
-        persist_registrable_entities(serializable_entities, output_tmpdir)
-
+        archive_fname = None
         # If Fast serialization is enabled, then an archive is also created and packaged
         if fast_options and fast_options.copy_style != CopyFileDetection.NO_COPY:
             # If output exists and is a path within source, delete it so as to not re-bundle it again.
@@ -125,10 +139,11 @@ def package(
             archive_fname = fast_registration.fast_package(source, output_tmpdir, deref_symlinks, options=fast_options)
             click.secho(f"Fast mode enabled: compressed archive {archive_fname}", dim=True)
 
+        # The serialized entities are added to the package directly, rather than written out to files first.
         with tarfile.open(output, "w:gz") as tar:
-            files: typing.List[str] = os.listdir(output_tmpdir)
-            for ws_file in files:
-                tar.add(os.path.join(output_tmpdir, ws_file), arcname=ws_file)
+            add_registrable_entities_to_tar(serializable_entities, tar)
+            if archive_fname:
+                tar.add(archive_fname, arcname=os.path.basename(archive_fname))
 
     click.secho(f"Successfully packaged {len(serializable_entities)} flyte objects into {output}", fg="green")
 
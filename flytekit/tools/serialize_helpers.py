@@ -1,8 +1,12 @@
+import io
 import math
 import os
 import sys
+import tarfile
+import time
 import typing
 from collections import OrderedDict
+from concurrent import futures
 
 import click
 
@@ -60,26 +64,16 @@ def get_registrable_entities(
                 lp = LaunchPlan.get_default_launch_plan(ctx, entity)
                 get_serializable(new_api_serializable_entities, ctx.serialization_settings, lp, options)
 
-    new_api_model_values = list(new_api_serializable_entities.values())
-    entities_to_be_serialized = list(filter(_should_register_with_admin, new_api_model_values))
+    return [entity for entity in new_api_serializable_entities.values() if _should_register_with_admin(entity)]
 
-    return entities_to_be_serialized
 
-
-def persist_registrable_entities(entities: typing.List[FlyteControlPlaneEntity], folder: str):
+def _get_entity_file_names(entities: typing.List[FlyteControlPlaneEntity]) -> typing.List[str]:
     """
-    For protobuf serializable list of entities, writes a file with the name if the entity and
-    enumeration order to the specified folder
-
-    This function will write to the folder specified the following protobuf types ::
-        flyteidl.admin.launch_plan_pb2.LaunchPlan
-        flyteidl.admin.workflow_pb2.WorkflowSpec
-        flyteidl.admin.task_pb2.TaskSpec
-
-    These can be inspected by calling (in the launch plan case) ::
-        flyte-cli parse-proto -f filename.pb -p flyteidl.admin.launch_plan_pb2.LaunchPlan
+    Returns the file name for each entity, prefixed with its zero padded position in the list and suffixed with the
+    :py:class:`flytekit.models.core.identifier.ResourceType` index of the entity.
     """
     zero_padded_length = _determine_text_chars(len(entities))
+    fnames = []
     for i, entity in enumerate(entities):
         fname_index = str(i).zfill(zero_padded_length)
         if isinstance(entity, TaskSpec):
@@ -95,6 +89,45 @@ def persist_registrable_entities(entities: typing.List[FlyteControlPlaneEntity],
             click.secho(f"Entity is incorrect formatted {entity} - type {type(entity)}", fg="red")
             sys.exit(-1)
         click.secho(f"  Packaging {name} -> {fname}", dim=True)
-        fname = os.path.join(folder, fname)
-        with open(fname, "wb") as writer:
-            writer.write(entity.serialize_to_string())
+        fnames.append(fname)
+    return fnames
+
+
+def persist_registrable_entities(entities: typing.List[FlyteControlPlaneEntity], folder: str):
+    """
+    For protobuf serializable list of entities, writes a file with the name if the entity and
+    enumeration order to the specified folder
+
+    This function will write to the folder specified the following protobuf types ::
+        flyteidl.admin.launch_plan_pb2.LaunchPlan
+        flyteidl.admin.workflow_pb2.WorkflowSpec
+        flyteidl.admin.task_pb2.TaskSpec
+
+    These can be inspected by calling (in the launch plan case) ::
+        flyte-cli parse-proto -f filename.pb -p flyteidl.admin.launch_plan_pb2.LaunchPlan
+    """
+    fnames = [os.path.join(folder, fname) for fname in _get_entity_file_names(entities)]
+
+    # File names are fixed up front from the enumeration order, so the entities can be written out concurrently.
+    with futures.ThreadPoolExecutor() as executor:
+        list(executor.map(_write_entity, entities, fnames))
+
+
+def _write_entity(entity: FlyteControlPlaneEntity, fname: str):
+    with open(fname, "wb") as writer:
+        writer.write(entity.serialize_to_string())
+
+
+def add_registrable_entities_to_tar(entities: typing.List[FlyteControlPlaneEntity], tar: tarfile.TarFile):
+    """
+    Same as :py:func:`persist_registrable_entities`, but adds the serialized entities to the given tarfile as members
+    instead of writing them to a folder. This avoids creating and reading back a file per entity when the entities
+    only end up in an archive.
+    """
+    mtime = time.time()
+    for fname, entity in zip(_get_entity_file_names(entities), entities):
+        data = entity.serialize_to_string()
+        tar_info = tarfile.TarInfo(name=fname)
+        tar_info.size = len(data)
+        tar_info.mtime = mtime
+        tar.addfile(tar_info, io.BytesIO(data))
@@ -0,0 +1,49 @@
+from unittest import mock
+
+import rich_click as click
+from click.testing import CliRunner
+
+from flytekit.clis.sdk_in_container import pyflyte
+
+
+def test_lazy_subcommands():
+    ctx = click.Context(pyflyte.main)
+    assert set(pyflyte._LAZY_SUBCOMMANDS) <= set(pyflyte.main.list_commands(ctx))
+    for name in pyflyte._LAZY_SUBCOMMANDS:
+        assert pyflyte.main.get_command(ctx, name).name == name
+    assert pyflyte.main.get_command(ctx, "does-not-exist") is None
+
+
+def test_help_lists_lazy_subcommands():
+    result = CliRunner().invoke(pyflyte.main, ["--help"])
+    assert result.exit_code == 0
+    for name in ["run", "register", "serve", "local-cache"]:
+        assert name in result.output
+
+
+class _ReplaceRunPlugin:
+    @staticmethod
+    def configure_pyflyte_cli(main):
+        run = main.commands["run"]
+        main.add_command(click.Command("run", help=f"wrapped {run.name}"))
+        main.commands.pop("serve")
+        return main
+
+
+@mock.patch("flytekit.clis.sdk_in_container.pyflyte.get_plugin", return_value=_ReplaceRunPlugin)
+def test_plugin_sees_built_in_commands(mock_get_plugin):
+    group = pyflyte.LazySubcommandGroup("pyflyte", lazy_subcommands=pyflyte._LAZY_SUBCOMMANDS)
+    pyflyte._configure_pyflyte_cli(group)
+
+    ctx = click.Context(group)
+    assert group.get_command(ctx, "run").help == "wrapped run"
+    assert group.get_command(ctx, "serve") is None
+    assert "serve" not in group.list_commands(ctx)
+    assert group.get_command(ctx, "register").name == "register"
+
+
+@mock.patch("flytekit.clis.sdk_in_container.pyflyte.get_plugin", return_value=pyflyte.FlytekitPlugin)
+def test_default_plugin_keeps_commands_lazy(mock_get_plugin):
+    group = pyflyte.LazySubcommandGroup("pyflyte", lazy_subcommands=pyflyte._LAZY_SUBCOMMANDS)
+    pyflyte._configure_pyflyte_cli(group)
+    assert group.commands == {}
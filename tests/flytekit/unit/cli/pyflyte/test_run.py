@@ -15,6 +15,7 @@ from flytekit.loggers import logging, logger
 from flytekit.clis.sdk_in_container import pyflyte
 from flytekit.clis.sdk_in_container.run import (
     RunLevelParams,
+    WorkflowCommand,
     get_entities_in_file,
     run_command,
 )
@@ -38,6 +39,9 @@ IMPERATIVE_WORKFLOW_FILE = os.path.join(
     os.path.dirname(os.path.realpath(__file__)), "imperative_wf.py"
 )
 DIR_NAME = os.path.dirname(os.path.realpath(__file__))
+WORKFLOW_FILE = os.path.join(DIR_NAME, "workflow.py")
+TESTDATA_DIR = os.path.join(DIR_NAME, "testdata")
+CONFIG_DIR = pathlib.Path(__file__).parent.parent.parent / "configuration" / "configs"
 
 monkeypatch = pytest.MonkeyPatch()
 
@@ -60,6 +64,22 @@ def workflow_file(request, tmp_path_factory):
     raise ValueError("Invalid workflow file location")
 
 
+@pytest.fixture(scope="module")
+def runner():
+    # CliRunner keeps no state between invocations, so one instance is shared by all tests in this module
+    return CliRunner()
+
+
+def invoke_pyflyte(args):
+    """
+    Runs pyflyte in-process without CliRunner's output capturing, for tests that only need the command to succeed.
+    With standalone_mode=False click returns the code of a ``ctx.exit(n)`` instead of raising, so it is checked here.
+    """
+    rv = pyflyte.main.main(args, prog_name="pyflyte", standalone_mode=False)
+    assert not (type(rv) is int and rv != 0), f"pyflyte {' '.join(map(str, args))} exited with code {rv}"
+    return rv
+
+
 @pytest.fixture
 def remote():
     with mock.patch("flytekit.clients.friendly.SynchronousFlyteClient") as mock_client:
@@ -87,42 +107,27 @@ def remote():
 )
 def test_pyflyte_run_wf(remote, remote_flag, workflow_file):
     with mock.patch("flytekit.configuration.plugin.FlyteRemote"):
-        runner = CliRunner()
-        result = runner.invoke(
-            pyflyte.main,
+        invoke_pyflyte(
             ["run", remote_flag, workflow_file, "my_wf", "--help"],
-            catch_exceptions=False,
         )
 
-        assert result.exit_code == 0
-
 
 def test_pyflyte_run_with_labels():
     workflow_file = pathlib.Path(__file__).parent / "workflow.py"
     with mock.patch("flytekit.configuration.plugin.FlyteRemote"):
-        runner = CliRunner()
-        result = runner.invoke(
-            pyflyte.main,
+        invoke_pyflyte(
             ["run", "--remote", str(workflow_file), "my_wf", "--help"],
-            catch_exceptions=False,
         )
-        assert result.exit_code == 0
 
 
 def test_imperative_wf():
-    runner = CliRunner()
-    result = runner.invoke(
-        pyflyte.main,
+    invoke_pyflyte(
         ["run", IMPERATIVE_WORKFLOW_FILE, "wf", "--in1", "hello", "--in2", "world"],
-        catch_exceptions=False,
     )
-    assert result.exit_code == 0
 
 
 def test_copy_all_files():
-    runner = CliRunner()
-    result = runner.invoke(
-        pyflyte.main,
+    invoke_pyflyte(
         [
             "run",
             "--copy-all",
@@ -133,19 +138,13 @@ def test_copy_all_files():
             "--in2",
             "world",
         ],
-        catch_exceptions=False,
     )
-    assert result.exit_code == 0
 
 
 def test_remote_files():
-    runner = CliRunner()
-    result = runner.invoke(
-        pyflyte.main,
+    invoke_pyflyte(
         ["run", REMOTE_WORKFLOW_FILE, "my_wf", "--a", "1", "--b", "Hello"],
-        catch_exceptions=False,
     )
-    assert result.exit_code == 0
 
 
 @pytest.mark.parametrize(
@@ -156,9 +155,8 @@ def test_remote_files():
     ],
     indirect=["workflow_file"],
 )
-def test_pyflyte_run_cli(workflow_file):
-    runner = CliRunner()
-    parquet_file = os.path.join(DIR_NAME, "testdata/df.parquet")
+def test_pyflyte_run_cli(workflow_file, runner):
+    parquet_file = os.path.join(TESTDATA_DIR, "df.parquet")
     result = runner.invoke(
         pyflyte.main,
         [
@@ -188,9 +186,9 @@ def test_pyflyte_run_cli(workflow_file):
             "--l",
             '{"hello": "world"}',
             "--remote",
-            os.path.join(DIR_NAME, "testdata"),
+            TESTDATA_DIR,
             "--image",
-            os.path.join(DIR_NAME, "testdata"),
+            TESTDATA_DIR,
             "--h",
             "--n",
             json.dumps([{"x": parquet_file}]),
@@ -216,26 +214,22 @@ def test_pyflyte_run_cli(workflow_file):
     "input",
     [
         "1",
-        os.path.join(DIR_NAME, "testdata/df.parquet"),
+        os.path.join(TESTDATA_DIR, "df.parquet"),
         '{"x":1.0, "y":2.0}',
         "2020-05-01",
         "RED",
     ],
 )
 def test_union_type1(input):
-    runner = CliRunner()
-    result = runner.invoke(
-        pyflyte.main,
+    invoke_pyflyte(
         [
             "run",
-            os.path.join(DIR_NAME, "workflow.py"),
+            WORKFLOW_FILE,
             "test_union1",
             "--a",
             input,
         ],
-        catch_exceptions=False,
     )
-    assert result.exit_code == 0
 
 
 @pytest.mark.parametrize(
@@ -256,13 +250,12 @@ def test_union_type1(input):
         (("--no-a-b",), "test_boolean_default_false", False),
     ],
 )
-def test_boolean_type(extra_cli_args, task_name, expected_output):
-    runner = CliRunner()
+def test_boolean_type(extra_cli_args, task_name, expected_output, runner):
     result = runner.invoke(
         pyflyte.main,
         [
             "run",
-            os.path.join(DIR_NAME, "workflow.py"),
+            WORKFLOW_FILE,
             task_name,
             *extra_cli_args,
         ],
@@ -272,42 +265,39 @@ def test_boolean_type(extra_cli_args, task_name, expected_output):
     assert str(expected_output) in result.stdout
 
 
-def test_all_types_with_json_input():
-    runner = CliRunner()
+def test_all_types_with_json_input(runner):
     result = runner.invoke(
         pyflyte.main,
         [
             "run",
-            os.path.join(DIR_NAME, "workflow.py"),
+            WORKFLOW_FILE,
             "my_wf",
             "--inputs-file",
-            os.path.join(os.path.dirname(os.path.realpath(__file__)), "my_wf_input.json"),
+            os.path.join(DIR_NAME, "my_wf_input.json"),
         ],
         catch_exceptions=False,
     )
     assert result.exit_code == 0, result.stdout
 
 
-def test_all_types_with_yaml_input():
-    runner = CliRunner()
+def test_all_types_with_yaml_input(runner):
 
     result = runner.invoke(
         pyflyte.main,
-        ["run", os.path.join(DIR_NAME, "workflow.py"), "my_wf", "--inputs-file", os.path.join(os.path.dirname(os.path.realpath(__file__)), "my_wf_input.yaml")],
+        ["run", WORKFLOW_FILE, "my_wf", "--inputs-file", os.path.join(DIR_NAME, "my_wf_input.yaml")],
         catch_exceptions=False,
     )
     assert result.exit_code == 0, result.stdout
 
 
-def test_all_types_with_pipe_input(monkeypatch):
-    runner = CliRunner()
-    input= str(json.load(open(os.path.join(os.path.dirname(os.path.realpath(__file__)), "my_wf_input.json"),"r")))
+def test_all_types_with_pipe_input(monkeypatch, runner):
+    input= str(json.load(open(os.path.join(DIR_NAME, "my_wf_input.json"),"r")))
     monkeypatch.setattr("sys.stdin", io.StringIO(input))
     result = runner.invoke(
         pyflyte.main,
         [
             "run",
-            os.path.join(DIR_NAME, "workflow.py"),
+            WORKFLOW_FILE,
             "my_wf",
             "-",
         ],
@@ -324,10 +314,7 @@ def test_all_types_with_pipe_input(monkeypatch):
             str(
                 json.load(
                     open(
-                        os.path.join(
-                            os.path.dirname(os.path.realpath(__file__)),
-                            "my_wf_input.json",
-                        ),
+                        os.path.join(DIR_NAME, "my_wf_input.json"),
                         "r",
                     )
                 )
@@ -336,19 +323,16 @@ def test_all_types_with_pipe_input(monkeypatch):
         )
     ],
 )
-def test_replace_file_inputs(monkeypatch, pipe_input, option_input):
-    runner = CliRunner()
+def test_replace_file_inputs(monkeypatch, pipe_input, option_input, runner):
     monkeypatch.setattr("sys.stdin", io.StringIO(pipe_input))
     result = runner.invoke(
         pyflyte.main,
         [
             "run",
-            os.path.join(DIR_NAME, "workflow.py"),
+            WORKFLOW_FILE,
             "my_wf",
             "--inputs-file",
-            os.path.join(
-                os.path.dirname(os.path.realpath(__file__)), "my_wf_input.json"
-            ),
+            os.path.join(DIR_NAME, "my_wf_input.json"),
             "--k",
             option_input,
         ],
@@ -363,8 +347,7 @@ def test_replace_file_inputs(monkeypatch, pipe_input, option_input):
     "input",
     [2.0, '{"i":1,"a":["h","e"]}', "[1, 2, 3]"],
 )
-def test_union_type2(input):
-    runner = CliRunner()
+def test_union_type2(input, runner):
     env = "foo=bar"
     result = runner.invoke(
         pyflyte.main,
@@ -378,7 +361,7 @@ def test_union_type2(input):
             "flyte",
             "--tag",
             "hello",
-            os.path.join(DIR_NAME, "workflow.py"),
+            WORKFLOW_FILE,
             "test_union2",
             "--a",
             input,
@@ -388,14 +371,13 @@ def test_union_type2(input):
     assert result.exit_code == 0, result.stdout
 
 
-def test_union_type_with_invalid_input():
-    runner = CliRunner()
+def test_union_type_with_invalid_input(runner):
     result = runner.invoke(
         pyflyte.main,
         [
             "--verbose",
             "run",
-            os.path.join(DIR_NAME, "workflow.py"),
+            WORKFLOW_FILE,
             "test_union2",
             "--a",
             "hello",
@@ -451,6 +433,17 @@ def test_get_entities_in_file(workflow_file):
     ]
 
 
+def test_workflow_command_lists_entities_once():
+    cmd = WorkflowCommand(filename=WORKFLOW_FILE, name="workflow.py")
+    with mock.patch(
+        "flytekit.clis.sdk_in_container.run.get_entities_in_file", wraps=get_entities_in_file
+    ) as m:
+        names = cmd.list_commands(None)
+        assert cmd.list_commands(None) == names
+        m.assert_called_once()
+    assert names[:2] == ["my_wf", "wf_with_env_vars"]
+
+
 @pytest.mark.parametrize(
     "working_dir, wf_path",
     [
@@ -461,11 +454,9 @@ def test_get_entities_in_file(workflow_file):
         (pathlib.Path("test_nested_wf", "a", "b", "c", "d"), os.path.join("wf.py")),
     ],
 )
-def test_nested_workflow(working_dir, wf_path, monkeypatch: pytest.MonkeyPatch):
-    runner = CliRunner()
-    base_path = os.path.dirname(os.path.realpath(__file__))
+def test_nested_workflow(working_dir, wf_path, monkeypatch: pytest.MonkeyPatch, runner):
     # Change working directory without side-effects (i.e. just for this test)
-    monkeypatch.chdir(os.path.join(base_path, working_dir))
+    monkeypatch.chdir(os.path.join(DIR_NAME, working_dir))
     result = runner.invoke(
         pyflyte.main,
         [
@@ -489,18 +480,13 @@ def test_nested_workflow(working_dir, wf_path, monkeypatch: pytest.MonkeyPatch):
     [("collection_wf.py"), ("map_wf.py"), ("dataclass_wf.py")],
 )
 def test_list_default_arguments(wf_path):
-    runner = CliRunner()
-    dir_name = os.path.dirname(os.path.realpath(__file__))
-    result = runner.invoke(
-        pyflyte.main,
+    invoke_pyflyte(
         [
             "run",
-            os.path.join(dir_name, "default_arguments", wf_path),
+            os.path.join(DIR_NAME, "default_arguments", wf_path),
             "wf",
         ],
-        catch_exceptions=False,
     )
-    assert result.exit_code == 0
 
 
 # default case, what comes from click if no image is specified, the click param is configured to use the default.
@@ -546,7 +532,7 @@ ic_result_3 = ImageConfig(
     ],
 )
 
-IMAGE_SPEC = os.path.join(os.path.dirname(os.path.realpath(__file__)), "imageSpec.yaml")
+IMAGE_SPEC = os.path.join(DIR_NAME, "imageSpec.yaml")
 
 with open(IMAGE_SPEC, "r") as f:
     image_spec_dict = yaml.safe_load(f)
@@ -599,12 +585,7 @@ def test_pyflyte_run_run(
     image_tuple = (image_string,)
     image_config = ImageConfig.validate_image(None, "", image_tuple)
 
-    pp = (
-        pathlib.Path(__file__).parent.parent.parent
-        / "configuration"
-        / "configs"
-        / leaf_configuration_file_name
-    )
+    pp = CONFIG_DIR / leaf_configuration_file_name
 
     obj = RunLevelParams(
         project="p",
@@ -681,12 +662,7 @@ def test_pyflyte_run_with_iterator_json_type(
     image_tuple = ("ghcr.io/flyteorg/mydefault:py3.9-latest",)
     image_config = ImageConfig.validate_image(None, "", image_tuple)
 
-    pp = (
-        pathlib.Path(__file__).parent.parent.parent
-        / "configuration"
-        / "configs"
-        / "no_images.yaml"
-    )
+    pp = CONFIG_DIR / "no_images.yaml"
 
     obj = RunLevelParams(
         project="p",
@@ -772,8 +748,7 @@ class Color(enum.Enum):
     ],
     indirect=["workflow_file"],
 )
-def test_pyflyte_run_with_none(a_val, workflow_file):
-    runner = CliRunner()
+def test_pyflyte_run_with_none(a_val, workflow_file, runner):
     args = [
         "run",
         workflow_file,
@@ -813,8 +788,7 @@ def test_pyflyte_run_with_none(a_val, workflow_file):
     ],
     indirect=["workflow_file"],
 )
-def test_envvar_local_execution(envs, envs_argument, expected_output, workflow_file):
-    runner = CliRunner()
+def test_envvar_local_execution(envs, envs_argument, expected_output, workflow_file, runner):
     args = (
         [
             "run",
@@ -840,14 +814,12 @@ def test_envvar_local_execution(envs, envs_argument, expected_output, workflow_f
     "task_path",
     [("task_defaults.py")],
 )
-def test_list_default_arguments(task_path):
-    runner = CliRunner()
-    dir_name = os.path.dirname(os.path.realpath(__file__))
+def test_list_default_arguments(task_path, runner):
     result = runner.invoke(
         pyflyte.main,
         [
             "run",
-            os.path.join(dir_name, "default_arguments", task_path),
+            os.path.join(DIR_NAME, "default_arguments", task_path),
             "foo",
         ],
         catch_exceptions=False,
@@ -856,13 +828,12 @@ def test_list_default_arguments(task_path):
     assert result.stdout == "Running Execution on local.\n0 Hello Color.RED\n\n"
 
 
-def test_entity_non_found_in_file():
-    runner = CliRunner()
+def test_entity_non_found_in_file(runner):
     result = runner.invoke(
         pyflyte.main,
         [
             "run",
-            os.path.join(DIR_NAME, "workflow.py"),
+            WORKFLOW_FILE,
             "my_wffffff",
         ],
         catch_exceptions=False,
@@ -156,6 +156,7 @@ def test_secrets_manager_get_envvar():
     assert sec.get_secrets_env_var("group", "test", "v1") == f"{cfg.env_prefix}GROUP_V1_TEST"
     assert sec.get_secrets_env_var("group", group_version="v1") == f"{cfg.env_prefix}GROUP_V1"
     assert sec.get_secrets_env_var("group") == f"{cfg.env_prefix}GROUP"
+    assert sec.get_secrets_env_var("Group", "my-Key", "v1") == f"{cfg.env_prefix}GROUP_V1_MY-KEY"
 
 
 def test_secret_manager_no_group(monkeypatch):
@@ -190,9 +191,9 @@ def test_secrets_manager_get_file():
     )
 
 
-def test_secrets_manager_file(tmpdir: py.path.local):
+def test_secrets_manager_file(tmpdir: py.path.local, monkeypatch):
     tmp = tmpdir.mkdir("file_test").dirname
-    os.environ["FLYTE_SECRETS_DEFAULT_DIR"] = tmp
+    monkeypatch.setenv("FLYTE_SECRETS_DEFAULT_DIR", tmp)
     sec = SecretsManager()
     f = os.path.join(tmp, "test")
     with open(f, "w+") as w:
@@ -220,25 +221,34 @@ def test_secrets_manager_file(tmpdir: py.path.local):
     assert sec.get("group", "test") != base64_str
     assert sec.get("group", "test", encode_mode="rb") == base64_str
 
-    del os.environ["FLYTE_SECRETS_DEFAULT_DIR"]
 
-
-def test_secrets_manager_bad_env():
+def test_secrets_manager_bad_env(monkeypatch):
     with pytest.raises(ValueError):
-        os.environ["TEST"] = "value"
+        monkeypatch.setenv("TEST", "value")
         sec = SecretsManager()
         sec.get("group", "test")
 
 
-def test_secrets_manager_env():
+def test_secrets_manager_env(monkeypatch):
     sec = SecretsManager()
-    os.environ[sec.get_secrets_env_var("group", "test")] = "value"
+    monkeypatch.setenv(sec.get_secrets_env_var("group", "test"), "value")
     assert sec.get("group", "test") == "value"
 
-    os.environ[sec.get_secrets_env_var(group="group", key="key")] = "value"
+    monkeypatch.setenv(sec.get_secrets_env_var(group="group", key="key"), "value")
     assert sec.get(group="group", key="key") == "value"
 
 
+def test_secrets_manager_rereads_values(monkeypatch):
+    sec = SecretsManager()
+    env_var = sec.get_secrets_env_var("group", "cached")
+
+    # The secret itself is read on every access, so rotated values are picked up
+    monkeypatch.setenv(env_var, "value1")
+    assert sec.get("group", "cached") == "value1"
+    monkeypatch.setenv(env_var, "value2")
+    assert sec.get("group", "cached") == "value2"
+
+
 @pytest.mark.parametrize("is_local_execution, prefix", [(True, ""), (False, "_FSEC_")])
 def test_secrets_manager_execution(monkeypatch, is_local_execution, prefix):
     if not is_local_execution:
@@ -44,6 +44,7 @@ from flytekit.core.type_engine import (
     TypeTransformer,
     TypeTransformerFailedError,
     UnionTransformer,
+    _dict_msgpack_encoder,
     convert_marshmallow_json_schema_to_python_class,
     convert_mashumaro_json_schema_to_python_class,
     dataclass_from_dict,
@@ -1508,6 +1509,11 @@ def test_multi_inheritance_enum_type():
     assert isinstance(tfm, EnumTransformer)
 
 
+def test_get_transformer_plain_class_fast_path():
+    for t in (int, float, bool, str, datetime.datetime, datetime.date, timedelta, dict):
+        assert TypeEngine.get_transformer(t) is TypeEngine._REGISTRY[t]
+
+
 def union_type_tags_unique(t: LiteralType):
     seen = set()
     for x in t.union_type.variants:
@@ -3101,6 +3107,23 @@ def test_dataclass_encoder_and_decoder_registry():
     assert transformer._msgpack_decoder.get(Datum)
 
 
+@pytest.mark.asyncio
+async def test_DictTransformer_reuses_msgpack_encoder():
+    ctx = FlyteContext.current_context()
+    python_type = typing.Dict[int, str]
+    lt = TypeEngine.to_literal_type(python_type)
+
+    await TypeEngine.async_to_literal(ctx, {1: "a"}, python_type, lt)
+    encoder = _dict_msgpack_encoder.get(python_type)
+    assert encoder is not None
+
+    lv = await TypeEngine.async_to_literal(ctx, {2: "b"}, python_type, lt)
+    assert _dict_msgpack_encoder.get(python_type) is encoder
+    # The static signature is public API and keeps working without an instance
+    assert await DictTransformer.dict_to_binary_literal(ctx, {2: "b"}, python_type, False) == lv
+    assert TypeEngine.to_python_value(ctx, lv, python_type) == {2: "b"}
+
+
 def test_ListTransformer_get_sub_type():
     assert ListTransformer.get_sub_type_or_none(typing.List[str]) is str
 
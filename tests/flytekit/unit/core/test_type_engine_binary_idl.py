@@ -4,8 +4,11 @@ import tempfile
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, List, Optional, Union
+from unittest import mock
 
+import msgpack
 import pytest
 from google.protobuf import json_format as _json_format
 from google.protobuf import struct_pb2 as _struct
@@ -15,8 +18,8 @@ from mashumaro.codecs.msgpack import MessagePackEncoder
 from flytekit import task, workflow
 from flytekit.core.constants import MESSAGEPACK
 from flytekit.core.context_manager import FlyteContextManager
-from flytekit.core.type_engine import DataclassTransformer, TypeEngine
-from flytekit.models.literals import Binary, Literal, Scalar
+from flytekit.core.type_engine import DataclassTransformer, TypeEngine, _msgpack_dumps
+from flytekit.models.literals import Binary, Literal, LiteralCollection, Scalar
 from flytekit.types.directory import FlyteDirectory
 from flytekit.types.file import FlyteFile
 
@@ -27,112 +30,48 @@ class Status(Enum):
     REJECTED = "rejected"
 
 
-def test_simple_type_transformer():
+_SIMPLE_TYPE_INPUTS = [
+    *((int, v) for v in (1, 2, 20240918, -1, -2, -20240918)),
+    *((float, v) for v in (2024.0918, 5.0, -2024.0918, -5.0)),
+    *((bool, v) for v in (True, False)),
+    *((str, v) for v in ("hello", "world", "flyte", "kit", "is", "awesome")),
+    *(
+        (datetime, v)
+        for v in (
+            datetime(2024, 1, 1),
+            datetime(2024, 9, 18),
+            datetime(2024, 9, 18, 1),
+            datetime(2024, 9, 18, 1, 1),
+            datetime(2024, 9, 18, 1, 1, 1),
+            datetime(2024, 9, 18, 1, 1, 1, 1),
+        )
+    ),
+    *((date, v) for v in (date(2024, 1, 1), date(2024, 9, 18))),
+    *(
+        (timedelta, v)
+        for v in (
+            timedelta(days=1),
+            timedelta(days=1, seconds=1),
+            timedelta(days=1, seconds=1, microseconds=1),
+            timedelta(days=1, seconds=1, microseconds=1, milliseconds=1),
+            timedelta(days=1, seconds=1, microseconds=1, milliseconds=1, minutes=1),
+            timedelta(days=1, seconds=1, microseconds=1, milliseconds=1, minutes=1, hours=1),
+            timedelta(days=1, seconds=1, microseconds=1, milliseconds=1, minutes=1, hours=1, weeks=1),
+            timedelta(days=-1, seconds=-1, microseconds=-1, milliseconds=-1, minutes=-1, hours=-1, weeks=-1),
+        )
+    ),
+]
+
+# One encoder per type, shared by all the parametrized cases of that type
+_msgpack_encoder = lru_cache(maxsize=None)(MessagePackEncoder)
+
+
+@pytest.mark.parametrize("python_type, python_val", _SIMPLE_TYPE_INPUTS)
+def test_simple_type_transformer(python_type, python_val):
     ctx = FlyteContextManager.current_context()
-
-    int_inputs = [1, 2, 20240918, -1, -2, -20240918]
-    encoder = MessagePackEncoder(int)
-    for int_input in int_inputs:
-        int_msgpack_bytes = encoder.encode(int_input)
-        lv = Literal(
-            scalar=Scalar(binary=Binary(value=int_msgpack_bytes, tag=MESSAGEPACK))
-        )
-        int_output = TypeEngine.to_python_value(ctx, lv, int)
-        assert int_input == int_output
-
-    float_inputs = [2024.0918, 5.0, -2024.0918, -5.0]
-    encoder = MessagePackEncoder(float)
-    for float_input in float_inputs:
-        float_msgpack_bytes = encoder.encode(float_input)
-        lv = Literal(
-            scalar=Scalar(binary=Binary(value=float_msgpack_bytes, tag=MESSAGEPACK))
-        )
-        float_output = TypeEngine.to_python_value(ctx, lv, float)
-        assert float_input == float_output
-
-    bool_inputs = [True, False]
-    encoder = MessagePackEncoder(bool)
-    for bool_input in bool_inputs:
-        bool_msgpack_bytes = encoder.encode(bool_input)
-        lv = Literal(
-            scalar=Scalar(binary=Binary(value=bool_msgpack_bytes, tag=MESSAGEPACK))
-        )
-        bool_output = TypeEngine.to_python_value(ctx, lv, bool)
-        assert bool_input == bool_output
-
-    str_inputs = ["hello", "world", "flyte", "kit", "is", "awesome"]
-    encoder = MessagePackEncoder(str)
-    for str_input in str_inputs:
-        str_msgpack_bytes = encoder.encode(str_input)
-        lv = Literal(
-            scalar=Scalar(binary=Binary(value=str_msgpack_bytes, tag=MESSAGEPACK))
-        )
-        str_output = TypeEngine.to_python_value(ctx, lv, str)
-        assert str_input == str_output
-
-    datetime_inputs = [
-        datetime.now(),
-        datetime(2024, 9, 18),
-        datetime(2024, 9, 18, 1),
-        datetime(2024, 9, 18, 1, 1),
-        datetime(2024, 9, 18, 1, 1, 1),
-        datetime(2024, 9, 18, 1, 1, 1, 1),
-    ]
-    encoder = MessagePackEncoder(datetime)
-    for datetime_input in datetime_inputs:
-        datetime_msgpack_bytes = encoder.encode(datetime_input)
-        lv = Literal(
-            scalar=Scalar(binary=Binary(value=datetime_msgpack_bytes, tag=MESSAGEPACK))
-        )
-        datetime_output = TypeEngine.to_python_value(ctx, lv, datetime)
-        assert datetime_input == datetime_output
-
-    date_inputs = [date.today(), date(2024, 9, 18)]
-    encoder = MessagePackEncoder(date)
-    for date_input in date_inputs:
-        date_msgpack_bytes = encoder.encode(date_input)
-        lv = Literal(
-            scalar=Scalar(binary=Binary(value=date_msgpack_bytes, tag=MESSAGEPACK))
-        )
-        date_output = TypeEngine.to_python_value(ctx, lv, date)
-        assert date_input == date_output
-
-    timedelta_inputs = [
-        timedelta(days=1),
-        timedelta(days=1, seconds=1),
-        timedelta(days=1, seconds=1, microseconds=1),
-        timedelta(days=1, seconds=1, microseconds=1, milliseconds=1),
-        timedelta(days=1, seconds=1, microseconds=1, milliseconds=1, minutes=1),
-        timedelta(
-            days=1, seconds=1, microseconds=1, milliseconds=1, minutes=1, hours=1
-        ),
-        timedelta(
-            days=1,
-            seconds=1,
-            microseconds=1,
-            milliseconds=1,
-            minutes=1,
-            hours=1,
-            weeks=1,
-        ),
-        timedelta(
-            days=-1,
-            seconds=-1,
-            microseconds=-1,
-            milliseconds=-1,
-            minutes=-1,
-            hours=-1,
-            weeks=-1,
-        ),
-    ]
-    encoder = MessagePackEncoder(timedelta)
-    for timedelta_input in timedelta_inputs:
-        timedelta_msgpack_bytes = encoder.encode(timedelta_input)
-        lv = Literal(
-            scalar=Scalar(binary=Binary(value=timedelta_msgpack_bytes, tag=MESSAGEPACK))
-        )
-        timedelta_output = TypeEngine.to_python_value(ctx, lv, timedelta)
-        assert timedelta_input == timedelta_output
+    msgpack_bytes = _msgpack_encoder(python_type).encode(python_val)
+    lv = Literal(scalar=Scalar(binary=Binary(value=msgpack_bytes, tag=MESSAGEPACK)))
+    assert TypeEngine.to_python_value(ctx, lv, python_type) == python_val
 
 
 def test_untyped_dict():
@@ -182,9 +121,9 @@ def test_untyped_dict():
         },
     ]
 
+    encoder = MessagePackEncoder(dict)
     for dict_input in dict_inputs:
-        # dict_msgpack_bytes = msgpack.dumps(dict_input)
-        dict_msgpack_bytes = MessagePackEncoder(dict).encode(dict_input)
+        dict_msgpack_bytes = encoder.encode(dict_input)
         lv = Literal(
             scalar=Scalar(binary=Binary(value=dict_msgpack_bytes, tag=MESSAGEPACK))
         )
@@ -192,6 +131,49 @@ def test_untyped_dict():
         assert dict_input == dict_output
 
 
+def test_msgpack_dumps_reuses_packer():
+    d = {1: "a", "key": [2.5, True], "nested": {"b": b"bytes"}}
+    assert _msgpack_dumps(d) == msgpack.dumps(d)
+    with pytest.raises(TypeError):
+        _msgpack_dumps({"bad": object()})
+    # A failed pack must not leave stale bytes in the shared buffer
+    assert _msgpack_dumps(d) == msgpack.dumps(d)
+    with mock.patch("flytekit.core.type_engine.msgpack.Packer") as m:
+        _msgpack_dumps(d)
+        m.assert_not_called()
+
+
+def test_untyped_dict_list_batch():
+    ctx = FlyteContextManager.current_context()
+
+    dict_inputs = [
+        {1: "a", "key": 2.5, True: False},
+        {"nested_dict": {-1: 2, "key": "value"}, 3.14: [1, "b"]},
+        {},
+    ]
+    encoder = MessagePackEncoder(dict)
+    lv = Literal(
+        collection=LiteralCollection(
+            literals=[
+                Literal(scalar=Scalar(binary=Binary(value=encoder.encode(d), tag=MESSAGEPACK)))
+                for d in dict_inputs
+            ]
+        )
+    )
+    with mock.patch.object(TypeEngine, "async_to_python_value", wraps=TypeEngine.async_to_python_value) as m:
+        assert TypeEngine.to_python_value(ctx, lv, List[dict]) == dict_inputs
+        # Only the outer list goes through the type engine, the dicts are decoded in a single batch
+        assert m.call_count == 1
+
+    # A literal that is not a msgpack binary falls back to converting the literals one by one
+    lv.collection.literals.append(
+        Literal(scalar=Scalar(generic=_json_format.Parse(json.dumps({"a": "b"}), _struct.Struct())))
+    )
+    with mock.patch.object(TypeEngine, "async_to_python_value", wraps=TypeEngine.async_to_python_value) as m:
+        assert TypeEngine.to_python_value(ctx, lv, List[dict]) == dict_inputs + [{"a": "b"}]
+        assert m.call_count == 1 + len(lv.collection.literals)
+
+
 def test_list_transformer():
     ctx = FlyteContextManager.current_context()
 
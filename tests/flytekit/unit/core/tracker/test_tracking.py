@@ -1,10 +1,12 @@
+import os
 import typing
+from unittest import mock
 
 import pytest
 
 from flytekit import task
 from flytekit.configuration.feature_flags import FeatureFlags
-from flytekit.core.tracker import extract_task_module
+from flytekit.core.tracker import _ModuleSanitizer, extract_task_module
 from tests.flytekit.unit.core.tracker import d
 from tests.flytekit.unit.core.tracker.b import b_local_a, local_b
 from tests.flytekit.unit.core.tracker.c import b_in_c, c_local_a
@@ -86,3 +88,14 @@ local_task = task(d.inner_function)
 
 def test_local_task_wrap():
     assert local_task.instantiated_in == "tests.flytekit.unit.core.tracker.test_tracking"
+
+
+def test_module_sanitizer_caches_absolute_module_name():
+    sanitizer = _ModuleSanitizer()
+    path = d.__file__
+    with mock.patch("os.listdir", wraps=os.listdir) as listdir:
+        name = sanitizer.get_absolute_module_name(path)
+        calls = listdir.call_count
+        assert sanitizer.get_absolute_module_name(path) == name
+        assert listdir.call_count == calls
+    assert name.endswith("tests.flytekit.unit.core.tracker.d")
@@ -1,4 +1,5 @@
 import datetime
+import inspect
 import sys
 
 import pytest
@@ -258,3 +259,32 @@ def test_python_dependency_renderer():
 
         # Assert that the button of copy
         assert 'button onclick="copyTable()"' in result
+
+
+@mock.patch("flytekit.deck.deck._output_deck")
+def test_source_code_deck_rendered_once(_output_deck):
+    @task(enable_deck=True, deck_fields=(DeckField.SOURCE_CODE.value,))
+    def t1(a: int) -> str:
+        return str(a)
+
+    with mock.patch("inspect.getsource", wraps=inspect.getsource) as getsource:
+        t1(a=3)
+        t1(a=4)
+        assert getsource.call_count == 1
+    assert t1._source_code_html is not None
+
+
+@mock.patch("flytekit.core.python_function_task._python_dependencies_html_cache", None)
+def test_python_dependencies_html_does_not_cache_errors():
+    from flytekit.core.python_function_task import _python_dependencies_html
+
+    with patch("subprocess.check_output", side_effect=OSError("pip is unavailable")):
+        assert _python_dependencies_html() == PythonDependencyRenderer.FETCH_ERROR_HTML
+
+    with patch("subprocess.check_output") as mock_check_output:
+        mock_check_output.return_value = '[{"name": "numpy", "version": "1.21.0"}]'.encode()
+        html = _python_dependencies_html()
+        assert "numpy" in html
+        assert _python_dependencies_html() == html
+        # pip list and pip freeze run once, the second call is served from the cache
+        assert mock_check_output.call_count == 2
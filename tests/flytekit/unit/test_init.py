@@ -0,0 +1,61 @@
+import subprocess
+import sys
+from unittest import mock
+
+import pytest
+
+import flytekit
+
+
+def test_lazy_attributes():
+    from flytekit.remote import FlyteRemote
+
+    assert "FlyteRemote" in dir(flytekit)
+    assert flytekit.FlyteRemote is FlyteRemote
+    assert "FlyteRemote" in vars(flytekit)
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match="has no attribute 'does_not_exist'"):
+        flytekit.does_not_exist
+
+
+@mock.patch("flytekit._entry_points")
+def test_load_implicit_plugins_discovers_once(mock_entry_points):
+    plugin = mock.MagicMock()
+    mock_entry_points.return_value = [plugin]
+    flytekit._discover_implicit_plugins.cache_clear()
+    try:
+        flytekit.load_implicit_plugins()
+        flytekit.load_implicit_plugins()
+    finally:
+        flytekit._discover_implicit_plugins.cache_clear()
+
+    mock_entry_points.assert_called_once_with(group="flytekit.plugins")
+    assert plugin.load.call_count == 2
+
+
+def test_rich_excepthook():
+    err = ValueError("boom")
+    with mock.patch("rich.console.Console") as mock_console:
+        flytekit._rich_excepthook(ValueError, err, None)
+    mock_console.assert_called_once_with(stderr=True)
+    mock_console.return_value.print.assert_called_once()
+
+
+def test_import_does_not_load_ipython():
+    assert "interactive" not in vars(flytekit)
+    code = "import sys, flytekit; assert 'IPython' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_all_names_resolve():
+    for name in flytekit.__all__:
+        assert getattr(flytekit, name) is not None
+
+
+def test_star_import_keeps_eager_exports():
+    namespace = {}
+    exec("from flytekit import *", namespace)
+    assert namespace["logger"] is flytekit.logger
+    assert namespace["LOGGING_RICH_FMT_ENV_VAR"] == flytekit.LOGGING_RICH_FMT_ENV_VAR
@@ -4,6 +4,7 @@ import tarfile
 import time
 from hashlib import md5
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
@@ -12,9 +13,11 @@ from flytekit.tools.fast_registration import (
     FAST_FILEENDING,
     FAST_PREFIX,
     FastPackageOptions,
+    compress_tarball,
     compute_digest,
     fast_package,
     get_additional_distribution_loc,
+    open_compressed_tarball,
 )
 from flytekit.tools.ignore import DockerIgnore, GitIgnore, Ignore, IgnoreGroup, StandardIgnore
 from tests.flytekit.unit.tools.test_ignore import make_tree
@@ -202,3 +205,73 @@ def test_package_with_pigz(flyte_project, tmp_path):
 
     # Compare the md5sum of the two tarballs
     assert md5(archive_1_bytes).hexdigest() == md5(Path(archive_fname_2).read_bytes()).hexdigest()
+
+
+@mock.patch("flytekit.tools.fast_registration.shutil.which", return_value=None)
+def test_package_without_pigz(mock_which, flyte_project, tmp_path):
+    # Same as test_package_with_pigz, for the gzip fallback. Each packaging run writes to a temporary file named after
+    # the process id, which must not leak into the archive bytes.
+    options = FastPackageOptions(ignores=[], copy_style=CopyFileDetection.ALL)
+
+    Path(tmp_path / "dir1").mkdir()
+    with mock.patch("flytekit.tools.fast_registration.os.getpid", return_value=1):
+        archive_fname_1 = fast_package(source=flyte_project, output_dir=tmp_path / "dir1", options=options)
+    archive_1_bytes = Path(archive_fname_1).read_bytes()
+    Path(archive_fname_1).unlink()
+
+    time.sleep(1)
+
+    Path(tmp_path / "dir2").mkdir()
+    with mock.patch("flytekit.tools.fast_registration.os.getpid", return_value=2):
+        archive_fname_2 = fast_package(source=flyte_project, output_dir=tmp_path / "dir2", options=options)
+
+    assert md5(archive_1_bytes).hexdigest() == md5(Path(archive_fname_2).read_bytes()).hexdigest()
+
+
+@mock.patch("flytekit.tools.fast_registration.shutil.which", return_value=None)
+def test_open_compressed_tarball_without_pigz(mock_which, tmp_path):
+    source = tmp_path / "source.txt"
+    source.write_text("Hello World!")
+    output = tmp_path / "out.tar.gz"
+
+    with open_compressed_tarball(output) as tar:
+        tar.add(source, arcname="source.txt")
+
+    with tarfile.open(output, "r:gz") as tar:
+        assert tar.getnames() == ["source.txt"]
+        assert tar.extractfile("source.txt").read() == b"Hello World!"
+
+
+@mock.patch("flytekit.tools.fast_registration.shutil.which", return_value=None)
+def test_open_compressed_tarball_failure_leaves_no_archive(mock_which, tmp_path):
+    output = tmp_path / "out.tar.gz"
+
+    with pytest.raises(RuntimeError):
+        with open_compressed_tarball(output):
+            raise RuntimeError("boom")
+
+    assert os.listdir(tmp_path) == []
+
+
+@mock.patch("flytekit.tools.fast_registration.shutil.which", return_value=None)
+def test_compress_tarball(mock_which, tmp_path):
+    source = tmp_path / "source.txt"
+    source.write_text("Hello World!")
+    tar_path = tmp_path / "source.tar"
+    with tarfile.open(tar_path, "w") as tar:
+        tar.add(source, arcname="source.txt")
+    output = tmp_path / "out.tar.gz"
+
+    compress_tarball(tar_path, output)
+
+    with tarfile.open(output, "r:gz") as tar:
+        assert tar.extractfile("source.txt").read() == b"Hello World!"
+    assert sorted(os.listdir(tmp_path)) == ["out.tar.gz", "source.tar", "source.txt"]
+
+
+@mock.patch("flytekit.tools.fast_registration.compute_digest")
+def test_package_with_ls_files_skips_digest_walk(mock_compute_digest, flyte_project, tmp_path):
+    options = FastPackageOptions(ignores=[], copy_style=CopyFileDetection.ALL)
+    archive_fname = fast_package(source=flyte_project, output_dir=tmp_path, options=options)
+    mock_compute_digest.assert_not_called()
+    assert str(os.path.basename(archive_fname)).startswith(FAST_PREFIX)
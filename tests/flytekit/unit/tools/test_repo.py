@@ -7,7 +7,7 @@ import pytest
 
 import flytekit.configuration
 from flytekit.configuration import DefaultImages, ImageConfig
-from flytekit.tools.repo import find_common_root, list_packages_and_modules
+from flytekit.tools.repo import find_common_root, list_packages_and_modules, serialize_load_only
 
 task_text = """
 from flytekit import task
@@ -68,3 +68,19 @@ def test_module_loading(mock_entities, mock_entities_2):
 
         x = list_packages_and_modules(pathlib.Path(root), [bottom_level])
         assert len(x) == 1
+
+
+@mock.patch("flytekit.tools.module_loader.just_load_modules")
+def test_serialize_load_only_walks_packages_every_time(mock_load, tmp_path):
+    serialization_settings = flytekit.configuration.SerializationSettings(
+        project="project",
+        domain="domain",
+        version="version",
+        env=None,
+        image_config=ImageConfig.auto(img_name=DefaultImages.default_image()),
+    )
+
+    # Modules may have been added since the last call, so the packages are walked again
+    serialize_load_only(["a", "b"], serialization_settings, str(tmp_path))
+    serialize_load_only(["a", "b"], serialization_settings, str(tmp_path))
+    assert mock_load.call_args_list == [mock.call(pkgs=["a", "b"])] * 2
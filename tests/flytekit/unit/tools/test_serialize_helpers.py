@@ -0,0 +1,85 @@
+import os
+import tarfile
+from collections import OrderedDict
+
+import pytest
+
+from flytekit.configuration import Image, ImageConfig, SerializationSettings
+from flytekit.core.task import task
+from flytekit.core.workflow import workflow
+from flytekit.tools.serialize_helpers import (
+    _get_entity_file_names,
+    add_registrable_entities_to_tar,
+    persist_registrable_entities,
+)
+from flytekit.tools.translator import get_serializable
+
+default_img = Image(name="default", fqn="test", tag="tag")
+serialization_settings = SerializationSettings(
+    project="project",
+    domain="domain",
+    version="version",
+    env=None,
+    image_config=ImageConfig(default_image=default_img, images=[default_img]),
+)
+
+
+@task
+def t1(a: int) -> int:
+    return a + 1
+
+
+@task
+def t2(b: str) -> str:
+    return b
+
+
+@workflow
+def wf(a: int) -> int:
+    return t1(a=a)
+
+
+@pytest.fixture
+def entities():
+    serialized = OrderedDict()
+    for entity in [t1, t2, wf]:
+        get_serializable(serialized, serialization_settings, entity)
+    specs = [serialized[t1], serialized[t2], serialized[wf]]
+    # The same entity twice, the index prefix keeps the file names apart
+    return specs + [serialized[t1]]
+
+
+def _read_folder(folder):
+    contents = {}
+    for fname in os.listdir(folder):
+        with open(os.path.join(folder, fname), "rb") as f:
+            contents[fname] = f.read()
+    return contents
+
+
+def test_persist_registrable_entities_matches_sequential_writes(entities, tmp_path):
+    expected_dir = tmp_path / "expected"
+    expected_dir.mkdir()
+    for fname, entity in zip(_get_entity_file_names(entities), entities):
+        with open(expected_dir / fname, "wb") as f:
+            f.write(entity.serialize_to_string())
+
+    actual_dir = tmp_path / "actual"
+    actual_dir.mkdir()
+    persist_registrable_entities(entities, str(actual_dir))
+
+    actual = _read_folder(actual_dir)
+    assert actual == _read_folder(expected_dir)
+    assert sorted(actual) == [f"0_{t1.name}_1.pb", f"1_{t2.name}_1.pb", f"2_{wf.name}_2.pb", f"3_{t1.name}_1.pb"]
+
+
+def test_add_registrable_entities_to_tar(entities, tmp_path):
+    archive = tmp_path / "entities.tar"
+    with tarfile.open(archive, "w") as tar:
+        add_registrable_entities_to_tar(entities, tar)
+
+    with tarfile.open(archive, "r") as tar:
+        assert tar.getnames() == _get_entity_file_names(entities)
+        for member, entity in zip(tar.getmembers(), entities):
+            assert member.isfile()
+            assert tar.extractfile(member).read() == entity.serialize_to_string()